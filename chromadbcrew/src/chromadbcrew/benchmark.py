@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from chromadbcrew.numpy_knowledge_storage import NumpyVectorIndex
+
+# Compares cold start and query latency of a Chroma collection with the
+# memory-mapped NumPy index on random vectors.
+# Usage: benchmark [sizes] [dimension], e.g. benchmark 10000,100000,1000000 384
+
+BATCH_SIZE = 5000
+QUERIES = 100
+TOP_K = 5
+
+
+def _batches(size: int, dim: int):
+    rng = np.random.default_rng(42)
+    for start in range(0, size, BATCH_SIZE):
+        count = min(BATCH_SIZE, size - start)
+        ids = [f"chunk-{i}" for i in range(start, start + count)]
+        yield ids, rng.standard_normal((count, dim), dtype=np.float32), [f"document {i}" for i in ids], [{"row": i} for i in range(start, start + count)]
+
+
+def _latency(query, queries: np.ndarray) -> float:
+    """Mean milliseconds per single-vector query."""
+    start = time.perf_counter()
+    for vector in queries:
+        query(vector)
+    return (time.perf_counter() - start) * 1000 / len(queries)
+
+
+def bench_chroma(path: Path, size: int, dim: int, queries: np.ndarray) -> dict:
+    import chromadb
+
+    client = chromadb.PersistentClient(path=str(path))
+    collection = client.create_collection("benchmark", metadata={"hnsw:space": "cosine"})
+    start = time.perf_counter()
+    for ids, vectors, documents, metadatas in _batches(size, dim):
+        collection.add(ids=ids, embeddings=vectors.tolist(), documents=documents, metadatas=metadatas)
+    build = time.perf_counter() - start
+    del client, collection
+
+    start = time.perf_counter()
+    collection = chromadb.PersistentClient(path=str(path)).get_collection("benchmark")
+    collection.query(query_embeddings=[queries[0].tolist()], n_results=TOP_K)
+    cold_start = time.perf_counter() - start
+
+    latency = _latency(lambda vector: collection.query(query_embeddings=[vector.tolist()], n_results=TOP_K), queries)
+    return {"build_s": build, "cold_start_s": cold_start, "query_ms": latency}
+
+
+def bench_numpy(path: Path, size: int, dim: int, queries: np.ndarray) -> dict:
+    start = time.perf_counter()
+    NumpyVectorIndex.from_batches(path, size, dim, _batches(size, dim))
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = NumpyVectorIndex(path)
+    index.query(queries[0], TOP_K)
+    cold_start = time.perf_counter() - start
+
+    latency = _latency(lambda vector: index.query(vector, TOP_K), queries)
+    return {"build_s": build, "cold_start_s": cold_start, "query_ms": latency}
+
+
+def run():
+    """
+    Run the vector store benchmark.
+    """
+    sizes = [int(size) for size in (sys.argv[1] if len(sys.argv) > 1 else "10000,100000,1000000").split(",")]
+    dim = int(sys.argv[2]) if len(sys.argv) > 2 else 384
+    queries = np.random.default_rng(7).standard_normal((QUERIES, dim), dtype=np.float32)
+
+    print(f"{'backend':<8} {'chunks':>9} {'build s':>9} {'cold start s':>13} {'query ms':>9}")
+    for size in sizes:
+        for name, bench in (("chroma", bench_chroma), ("numpy", bench_numpy)):
+            with tempfile.TemporaryDirectory() as directory:
+                result = bench(Path(directory) / name, size, dim, queries)
+            print(f"{name:<8} {size:>9} {result['build_s']:>9.2f} {result['cold_start_s']:>13.3f} {result['query_ms']:>9.2f}")
+
+
+if __name__ == "__main__":
+    run()
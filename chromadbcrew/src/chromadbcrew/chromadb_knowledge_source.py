@@ -1,12 +1,65 @@
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from crewai.utilities.paths import db_storage_path
 import chromadb
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Iterator, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pydantic import Field, PrivateAttr
+import hashlib
+import json
+import os
 
 
 class ChromaDBKnowledgeSource(BaseFileKnowledgeSource):
     """Knowledge source that fetches all data from a specified ChromaDB directory."""
 
+    streaming: bool = Field(
+        default=False,
+        description="Page through the collections while adding instead of loading everything up front.",
+    )
+    page_size: int = Field(
+        default=1000,
+        description="Number of records fetched from a collection per page in streaming mode.",
+    )
+    reuse_embeddings: bool = Field(
+        default=False,
+        description="Copy the stored vectors into the knowledge storage instead of re-embedding, when the models match.",
+    )
+    embedding_model: Optional[str] = Field(
+        default=None,
+        description="Embedding model used by the knowledge storage, e.g. nomic-embed-text.",
+    )
+    source_embedding_model: Optional[str] = Field(
+        default=None,
+        description="Embedding model of the source ChromaDB, defaults to the 'embedding_model' collection metadata.",
+    )
+    incremental: bool = Field(
+        default=False,
+        description="Only embed new or changed records and remove deleted ones, tracked in a manifest per source directory.",
+    )
+    parallel: bool = Field(
+        default=False,
+        description="Ingest the collections concurrently on a worker pool in streaming, passthrough and incremental mode.",
+    )
+    max_workers: Optional[int] = Field(
+        default=None,
+        description="Maximum number of collections ingested at the same time, defaults to the number of CPUs.",
+    )
+    batch_size: int = Field(
+        default=256,
+        description="Number of chunks embedded and upserted per storage call.",
+    )
+
+    _target_dimension: Optional[int] = PrivateAttr(default=None)
+
+    def model_post_init(self, _):
+        """Skips the eager load in streaming, passthrough and incremental mode, the pages are read in add()."""
+        if not self.streaming and not self.reuse_embeddings and not self.incremental:
+            return super().model_post_init(_)
+
+        self.safe_file_paths = self._process_file_paths()
+        self.validate_content()
+
     def load_content(self) -> Dict[Path, str]:
         """Loads data from ChromaDB located in the specified directory."""
         try:
@@ -24,7 +77,7 @@ class ChromaDBKnowledgeSource(BaseFileKnowledgeSource):
             if not collections:
                 raise ValueError("No collections found in ChromaDB.")
 
-            formatted_data = ""
+            formatted_data = []
 
             for collection in collections:
                 coll = client.get_collection(collection.name)
@@ -34,13 +87,57 @@ class ChromaDBKnowledgeSource(BaseFileKnowledgeSource):
                 documents = results.get("documents", [])
                 metadatas = results.get("metadatas", [None] * len(documents))  # Handle missing metadata
 
-                formatted_data += self._format_results(collection.name, documents, metadatas)
+                formatted_data.append(self._format_results(collection.name, documents, metadatas))
 
-            return {chroma_db_path: formatted_data}
+            return {chroma_db_path: "".join(formatted_data)}
 
         except Exception as e:
             raise ValueError(f"Failed to retrieve data from ChromaDB: {str(e)}")
 
+    def stream_content(self) -> Iterator[str]:
+        """Yields the formatted records page by page, one collection after the other."""
+        client, collections = self._connect()
+
+        for collection in collections:
+            yield from self._stream_collection(client.get_collection(collection.name))
+
+    def _stream_collection(self, coll) -> Iterator[str]:
+        """Yields the formatted records of a single collection page by page."""
+        for page in self._iter_pages(coll, include=["documents", "metadatas"]):
+            documents = page.get("documents") or []
+            metadatas = page.get("metadatas") or [None] * len(documents)
+            yield self._format_results(coll.name, documents, metadatas)
+
+    def _connect(self):
+        """Opens the ChromaDB directory and lists its collections."""
+        chroma_db_path = self._get_chroma_db_path()
+
+        if not chroma_db_path:
+            raise FileNotFoundError("No valid ChromaDB directory found in file_paths.")
+
+        client = chromadb.PersistentClient(path=str(chroma_db_path))
+
+        collections = client.list_collections()
+        if not collections:
+            raise ValueError("No collections found in ChromaDB.")
+
+        return client, collections
+
+    def _iter_pages(self, collection, include: List[str]) -> Iterator[Dict[str, Any]]:
+        """Reads a collection in pages of page_size records."""
+        offset = 0
+        while True:
+            page = collection.get(include=include, limit=self.page_size, offset=offset)
+            ids = page.get("ids") or []
+            if not ids:
+                return
+
+            yield page
+
+            if len(ids) < self.page_size:
+                return
+            offset += len(ids)
+
     def _get_chroma_db_path(self) -> Path:
         """Extracts the ChromaDB directory from file_paths."""
         for path in self.safe_file_paths:
@@ -60,18 +157,29 @@ class ChromaDBKnowledgeSource(BaseFileKnowledgeSource):
 
     def _format_results(self, collection_name: str, documents: list, metadatas: list) -> str:
         """Format ChromaDB results into readable text."""
-        formatted = f"\nCollection: {collection_name}\n"
-        formatted += "-" * 40 + "\n"
+        formatted = [f"\nCollection: {collection_name}\n", "-" * 40 + "\n"]
 
         for doc, meta in zip(documents, metadatas):
             metadata_str = f"Metadata: {meta}" if meta else "Metadata: None"
-            formatted += f"- {doc}\n  {metadata_str}\n"
+            formatted.append(f"- {doc}\n  {metadata_str}\n")
 
-        return formatted
+        return "".join(formatted)
 
     def add(self) -> None:
         """Processes and stores the fetched ChromaDB records."""
-        content = self.load_content()
+        if self.incremental:
+            self._add_incremental()
+            return
+
+        if self.reuse_embeddings:
+            self._add_passthrough()
+            return
+
+        if self.streaming:
+            self._add_streaming()
+            return
+
+        content = self.content or self.load_content()
         if not isinstance(content, dict):
             raise ValueError("Invalid content format retrieved from ChromaDB.")
 
@@ -80,3 +188,262 @@ class ChromaDBKnowledgeSource(BaseFileKnowledgeSource):
             self.chunks.extend(chunks)
 
         self._save_documents()
+
+    def _add_streaming(self) -> None:
+        """Chunks and stores every page as soon as it is read, so only one page per worker is held in memory."""
+        try:
+            client, collections = self._connect()
+            self._for_each_collection(client, collections, self._store_collection_text)
+        except Exception as e:
+            raise ValueError(f"Failed to retrieve data from ChromaDB: {str(e)}")
+
+    def _store_collection_text(self, coll) -> None:
+        """Formats, chunks and stores a collection page by page."""
+        for text in self._stream_collection(coll):
+            self._save_chunks(self._chunk_text(text))
+
+    def _save_chunks(self, chunks: List[str]) -> None:
+        """Saves chunks to the storage in batches of batch_size."""
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+
+        for start in range(0, len(chunks), self.batch_size):
+            self.storage.save(chunks[start : start + self.batch_size])
+
+    def _for_each_collection(self, client, collections: list, ingest: Callable[[Any], Any]) -> Dict[str, Any]:
+        """Runs ingest on every collection, on a worker pool in parallel mode, and returns the results by name."""
+        if not self.parallel:
+            return {collection.name: ingest(client.get_collection(collection.name)) for collection in collections}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers or os.cpu_count()) as pool:
+            futures = {
+                collection.name: pool.submit(ingest, client.get_collection(collection.name))
+                for collection in collections
+            }
+            return {name: future.result() for name, future in futures.items()}
+
+    def _add_passthrough(self) -> None:
+        """Copies the stored vectors of every collection whose embedder matches, re-embeds the others."""
+        try:
+            client, collections = self._connect()
+            self._for_each_collection(client, collections, self._copy_collection)
+        except Exception as e:
+            raise ValueError(f"Failed to retrieve data from ChromaDB: {str(e)}")
+
+    def _copy_collection(self, coll) -> None:
+        """Copies the vectors of a collection, or re-embeds its documents on a mismatch."""
+        if self._can_reuse_embeddings(coll):
+            for page in self._iter_pages(coll, include=["documents", "metadatas", "embeddings"]):
+                self._upsert_vectors(coll.name, page)
+            return
+
+        self._logger.log(
+            "warning",
+            f"Embedding model or dimension mismatch in collection {coll.name}, re-embedding its documents.",
+            color="yellow",
+        )
+        self._store_collection_text(coll)
+
+    def _can_reuse_embeddings(self, coll) -> bool:
+        """Checks a sample vector of the collection against the storage's embedder."""
+        sample = coll.get(include=["embeddings"], limit=1).get("embeddings")
+        return sample is not None and len(sample) > 0 and self._embeddings_match(coll, sample[0])
+
+    def _embeddings_match(self, coll, embedding) -> bool:
+        """Checks that the source vectors come from the same model and have the storage's dimension."""
+        source_model = self.source_embedding_model or (coll.metadata or {}).get("embedding_model")
+        if not source_model or not self.embedding_model or source_model != self.embedding_model:
+            return False
+
+        return len(embedding) == self._get_target_dimension()
+
+    def _get_target_dimension(self) -> int:
+        """Embeds a probe text once to learn the dimension of the storage's embedder."""
+        if self._target_dimension is None:
+            if not self.storage:
+                raise ValueError("No storage found to save documents.")
+            self._target_dimension = len(self.storage.embedder(["dimension probe"])[0])
+        return self._target_dimension
+
+    def _upsert_vectors(self, collection_name: str, page: Dict[str, Any]) -> None:
+        """Writes a page of source records with their existing vectors into the knowledge storage."""
+        if not self.storage or not self.storage.collection:
+            raise ValueError("No storage found to save documents.")
+
+        ids = page["ids"]
+        metadatas = page.get("metadatas") or [None] * len(ids)
+
+        self.storage.collection.upsert(
+            ids=[self._record_id(collection_name, record_id) for record_id in ids],
+            embeddings=page["embeddings"],
+            documents=page.get("documents"),
+            metadatas=[{**(meta or {}), "source_collection": collection_name} for meta in metadatas],
+        )
+
+    @staticmethod
+    def _record_id(collection_name: str, record_id: str) -> str:
+        """Stable storage id of a source record."""
+        return hashlib.sha256(f"{collection_name}/{record_id}".encode("utf-8")).hexdigest()
+
+    def _add_incremental(self) -> None:
+        """Syncs the knowledge storage with the source, touching only the records changed since the last run."""
+        if not self.storage or not self.storage.collection:
+            raise ValueError("No storage found to save documents.")
+
+        try:
+            chroma_db_path = self._get_chroma_db_path()
+            manifest_path = self._manifest_path(chroma_db_path)
+            manifest = self._load_manifest(manifest_path)
+
+            # The storage was reset since the last run, everything has to be embedded again
+            if self.storage.collection.count() == 0:
+                manifest = {}
+
+            stamp = self._source_stamp(chroma_db_path)
+            if stamp is not None and manifest.get("stamp") == stamp:
+                self._logger.log("info", f"ChromaDB unchanged since last sync: {chroma_db_path}", color="green")
+                return
+
+            client, collections = self._connect()
+            known = manifest.get("collections", {})
+            synced = self._for_each_collection(
+                client, collections, lambda coll: self._sync_collection(coll, known.get(coll.name, {}))
+            )
+
+            for name, records in known.items():
+                if name not in synced:
+                    self._delete_records(name, records)
+
+            self._save_manifest(
+                manifest_path,
+                {"source": str(chroma_db_path), "stamp": stamp, "collections": synced},
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to retrieve data from ChromaDB: {str(e)}")
+
+    def _sync_collection(self, coll, known: Dict[str, List]) -> Dict[str, List]:
+        """Upserts the new and changed records of a collection and deletes the removed ones.
+
+        Returns the manifest entries of the collection as {record_id: [content_hash, chunk_count]}.
+        """
+        reuse = self.reuse_embeddings and self._can_reuse_embeddings(coll)
+        records = {}
+
+        for page in self._iter_pages(coll, include=["documents", "metadatas"]):
+            ids = page["ids"]
+            documents = page.get("documents") or [None] * len(ids)
+            metadatas = page.get("metadatas") or [None] * len(ids)
+
+            changed = []
+            for record_id, doc, meta in zip(ids, documents, metadatas):
+                digest = self._record_hash(doc, meta)
+                previous = known.get(record_id)
+                if previous and previous[0] == digest:
+                    records[record_id] = previous
+                else:
+                    changed.append((record_id, doc, meta, digest))
+
+            if changed:
+                records.update(self._upsert_records(coll, changed, known, reuse))
+
+        removed = {record_id: entry for record_id, entry in known.items() if record_id not in records}
+        if removed:
+            self._delete_records(coll.name, removed)
+
+        return records
+
+    def _upsert_records(self, coll, changed: List[tuple], known: Dict[str, List], reuse: bool) -> Dict[str, List]:
+        """Embeds (or copies) the changed records of a page and writes them in one upsert."""
+        entries = {}
+        stale_ids = []
+
+        if reuse:
+            vectors = coll.get(ids=[record[0] for record in changed], include=["embeddings"])
+            vector_by_id = dict(zip(vectors["ids"], vectors["embeddings"]))
+
+            ids, embeddings, documents, metadatas = [], [], [], []
+            for record_id, doc, meta, digest in changed:
+                ids.append(self._record_id(coll.name, record_id))
+                embeddings.append(vector_by_id[record_id])
+                documents.append(doc)
+                metadatas.append({**(meta or {}), "source_collection": coll.name})
+                entries[record_id] = [digest, 1]
+                stale_ids.extend(self._chunk_ids(coll.name, record_id, known.get(record_id, [None, 0])[1])[1:])
+
+            self.storage.collection.upsert(ids=ids, embeddings=embeddings, documents=documents, metadatas=metadatas)
+        else:
+            ids, documents, metadatas = [], [], []
+            for record_id, doc, meta, digest in changed:
+                chunks = self._chunk_text(self._format_results(coll.name, [doc], [meta]))
+                chunk_ids = self._chunk_ids(coll.name, record_id, len(chunks))
+                ids.extend(chunk_ids)
+                documents.extend(chunks)
+                metadatas.extend({"source_collection": coll.name} for _ in chunks)
+                entries[record_id] = [digest, len(chunks)]
+                stale_ids.extend(self._chunk_ids(coll.name, record_id, known.get(record_id, [None, 0])[1])[len(chunks):])
+
+            for start in range(0, len(ids), self.batch_size):
+                end = start + self.batch_size
+                self.storage.collection.upsert(
+                    ids=ids[start:end], documents=documents[start:end], metadatas=metadatas[start:end]
+                )
+
+        if stale_ids:
+            self.storage.collection.delete(ids=stale_ids)
+
+        return entries
+
+    def _delete_records(self, collection_name: str, records: Dict[str, List]) -> None:
+        """Removes every stored chunk of the given source records."""
+        ids = []
+        for record_id, (_, chunk_count) in records.items():
+            ids.extend(self._chunk_ids(collection_name, record_id, chunk_count))
+        if ids:
+            self.storage.collection.delete(ids=ids)
+
+    @classmethod
+    def _chunk_ids(cls, collection_name: str, record_id: str, chunk_count: int) -> List[str]:
+        """Storage ids of the chunks of a source record, the first chunk keeps the record id."""
+        return [
+            cls._record_id(collection_name, record_id if index == 0 else f"{record_id}#{index}")
+            for index in range(chunk_count)
+        ]
+
+    @staticmethod
+    def _record_hash(document: Optional[str], metadata: Optional[Dict[str, Any]]) -> str:
+        """Content hash of a source record."""
+        payload = json.dumps([document, metadata], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _source_stamp(chroma_db_path: Path) -> Optional[List[int]]:
+        """Size and modification time of the source's sqlite file, any write to the source changes it."""
+        sqlite_path = Path(chroma_db_path) / "chroma.sqlite3"
+        if not sqlite_path.exists():
+            return None
+        stat = sqlite_path.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _manifest_path(self, chroma_db_path: Path) -> Path:
+        """Manifest file of this source directory and storage collection."""
+        collection_name = self.storage.collection_name or "knowledge"
+        key = hashlib.sha256(f"{Path(chroma_db_path).resolve()}|{collection_name}".encode("utf-8")).hexdigest()
+        return Path(db_storage_path()) / "knowledge" / "chromadb_manifests" / f"{key}.json"
+
+    @staticmethod
+    def _load_manifest(manifest_path: Path) -> Dict[str, Any]:
+        """Reads a manifest, a missing or broken one means a full sync."""
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def _save_manifest(manifest_path: Path, manifest: Dict[str, Any]) -> None:
+        """Writes the manifest through a temp file so an interrupted run never leaves it half written."""
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(manifest, file)
+        os.replace(tmp_path, manifest_path)
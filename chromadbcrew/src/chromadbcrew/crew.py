@@ -2,6 +2,10 @@ from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from chromadbcrew.chromadb_knowledge_source import ChromaDBKnowledgeSource
 from chromadbcrew.knowledge_loader import KnowledgeLoader
+from chromadbcrew.lazy_knowledge import LazyKnowledgeSource, LazyKnowledgeStorage
+from chromadbcrew.embedding_cache import EmbeddingCache, CachedEmbeddingFunction
+from chromadbcrew.shared_knowledge_store import SharedKnowledgeStore, SharedStoreKnowledgeStorage
+import os
 
 
 # # Initialize a persistent client pointing to the knowledge folder
@@ -20,12 +24,25 @@ from chromadbcrew.knowledge_loader import KnowledgeLoader
 
 
 
-chroma_knowledge = ChromaDBKnowledgeSource(
-    file_paths=["chromadb"],
+# Sources are only built, parsed and embedded on the agent's first knowledge query,
+# so importing this module does no directory scanning and opens no Chroma client
+chroma_knowledge = LazyKnowledgeSource(
+    factory=lambda: ChromaDBKnowledgeSource(
+        file_paths=["chromadb"],
+        streaming=True,
+        incremental=True,
+        parallel=True,
+        reuse_embeddings=True,
+        embedding_model="nomic-embed-text",
+    ),
 )
 
-knowledge_loader = KnowledgeLoader()
-knowledge_list = knowledge_loader.load_knowledge()
+# Set CREWAI_SHARED_KNOWLEDGE_DIR to keep the knowledge files in a store shared by all crews,
+# files like user_preference.txt are then embedded once instead of once per project
+shared_store = SharedKnowledgeStore() if os.getenv("CREWAI_SHARED_KNOWLEDGE_DIR") else None
+
+# iter_knowledge streams the sources, each one is stored as soon as it is built
+directory_knowledge = LazyKnowledgeSource(factory=lambda: KnowledgeLoader(shared_store=shared_store).iter_knowledge())
 
 @CrewBase
 class Chromadbcrew():
@@ -37,17 +54,25 @@ class Chromadbcrew():
 
 	@agent
 	def knowledge_agent(self) -> Agent:
+		embedder = {
+			"provider": "ollama",  # Use Ollama as the embedding provider
+			"config": {
+				"model": "nomic-embed-text",  # Example embedding model for Ollama
+				"api_key":"NA",
+			}
+		}
+		# Chunks that were already embedded once (by any crew sharing the cache) are not sent to Ollama again
+		embedder = CachedEmbeddingFunction.from_config(embedder, EmbeddingCache()).as_embedder()
 		return Agent(
 			config=self.agents_config['knowledge_agent'],
 			verbose=True,
-			knowledge_sources=knowledge_list,#[chroma_knowledge],
-				embedder={
-					"provider": "ollama",  # Use Ollama as the embedding provider
-					"config": {
-					"model": "nomic-embed-text",  # Example embedding model for Ollama
-						"api_key":"NA",
-					}
-				}
+			knowledge_sources=[directory_knowledge],#[chroma_knowledge],
+			knowledge_storage=(
+				SharedStoreKnowledgeStorage(shared_store, embedder=embedder, collection_name="knowledge_agent")
+				if shared_store
+				else LazyKnowledgeStorage(embedder=embedder, collection_name="knowledge_agent")
+			),
+			embedder=embedder
 		)
 
 	@task
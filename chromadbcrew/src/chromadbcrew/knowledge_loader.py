@@ -6,42 +6,131 @@ from crewai.knowledge.source.csv_knowledge_source import CSVKnowledgeSource
 from crewai.knowledge.source.excel_knowledge_source import ExcelKnowledgeSource
 from crewai.knowledge.source.json_knowledge_source import JSONKnowledgeSource
 from chromadbcrew.chromadb_knowledge_source import ChromaDBKnowledgeSource
-from typing import List
+from chromadbcrew.indexed_knowledge_source import FileManifest, IndexedFileKnowledgeSource
+from chromadbcrew.shared_knowledge_store import ContentAddressedKnowledgeSource, SharedKnowledgeStore, _ChunkCollector
+from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple, Type
+import os
+
+def _parse_in_worker(source_class: Type[BaseFileKnowledgeSource], file_path: Path) -> List[str]:
+    """Parses and chunks a file the same way its knowledge source would, without embedding it."""
+    source = source_class(file_paths=[file_path])
+    source.storage = _ChunkCollector()
+    source.add()
+    return source.storage.chunks
+
 
 class KnowledgeLoader:
     """Dynamically loads knowledge sources from the CrewAI knowledge folder."""
-    
-    def __init__(self):
+
+    # Suffix -> (knowledge source class, whether parsing is CPU heavy enough for a worker process)
+    SOURCE_REGISTRY: Dict[str, Tuple[Type[BaseFileKnowledgeSource], bool]] = {
+        ".txt": (TextFileKnowledgeSource, False),
+        ".pdf": (PDFKnowledgeSource, True),
+        ".csv": (CSVKnowledgeSource, False),
+        ".xlsx": (ExcelKnowledgeSource, True),
+        ".json": (JSONKnowledgeSource, False),
+    }
+
+    @classmethod
+    def register(cls, suffix: str, source_class: Type[BaseFileKnowledgeSource], cpu_heavy: bool = False) -> None:
+        """Plugs in a knowledge source class for a file suffix, e.g. register(".md", MarkdownKnowledgeSource)."""
+        cls.SOURCE_REGISTRY[suffix.lower()] = (source_class, cpu_heavy)
+
+    def __init__(self, manifest_path: Optional[Path] = None, recursive: bool = True, max_workers: Optional[int] = None, shared_store: Optional[SharedKnowledgeStore] = None):
         # Automatically use CrewAI's default knowledge directory if no path is provided
         self.path = Path(KNOWLEDGE_DIRECTORY).resolve()
+        self.recursive = recursive
+        self.max_workers = max_workers
+        # With a shared store, files are referenced by hash and embedded once for every crew using the store
+        self.shared_store = shared_store
         self.knowledge_sources = []
+        # Remembers which files are already stored, so unchanged files are not parsed again
+        self.manifest = FileManifest(manifest_path)
 
     def load_knowledge(self) -> List:
         """Detects file types in the folder and loads appropriate knowledge sources."""
-        
+        self.knowledge_sources.extend(self.iter_knowledge())
+        return self.knowledge_sources
+
+    def iter_knowledge(self) -> Iterator:
+        """Yields the knowledge sources of the folder, CPU heavy files as soon as their worker finishes parsing."""
         if not self.path.exists() or not self.path.is_dir():
             raise ValueError(f"Path does not exist or is not a directory: {self.path}")
 
-        for file in self.path.iterdir():
+        heavy_files = []
+
+        for file in self._discover():
             full_path = file.resolve()  # Get absolute path
 
-            if file.suffix == ".txt":
-                knowledge_source = TextFileKnowledgeSource(file_paths=[file.name])
-            elif file.suffix == ".pdf":
-                knowledge_source = PDFKnowledgeSource(file_paths=[file.name])
-            elif file.suffix == ".csv":
-                knowledge_source = CSVKnowledgeSource(file_paths=[file.name])
-            elif file.suffix == ".xlsx":
-                knowledge_source = ExcelKnowledgeSource(file_paths=[file.name])
-            elif file.suffix == ".json":
-                knowledge_source = JSONKnowledgeSource(file_paths=[file.name])
-            elif file.name.lower() == "chromadb" and file.is_dir():
-                knowledge_source = ChromaDBKnowledgeSource(file_paths=[file.name])
+            if file.is_dir():
                 print(f"✅ ChromaDB database loaded from: {full_path}")
-            else:
+                yield ChromaDBKnowledgeSource(file_paths=[full_path], streaming=True, incremental=True, parallel=True)
+                continue
+
+            registered = self.SOURCE_REGISTRY.get(file.suffix.lower())
+            if not registered:
                 print(f"⚠️ Skipping unsupported file type: {file.name}")
                 continue
 
-            self.knowledge_sources.append(knowledge_source)
+            source_class, cpu_heavy = registered
+            if self.shared_store:
+                blob = self.shared_store.put(full_path)
+                print(f"🔗 Shared store reference: {file.name} -> {blob[:12]}")
+                yield ContentAddressedKnowledgeSource(blob=blob, source_class=source_class, store=self.shared_store)
+                continue
+
+            chunk_ids = self.manifest.lookup(full_path)
+            if chunk_ids:
+                print(f"♻️ Already indexed, skipping parse: {file.name}")
+            elif cpu_heavy:
+                heavy_files.append((full_path, source_class))
+                continue
 
-        return self.knowledge_sources
+            # Light files are parsed when the source is added, if they are not stored yet
+            yield self._indexed_source(full_path, source_class, chunk_ids or [])
+
+        yield from self._parse_heavy_files(heavy_files)
+
+    def _discover(self) -> Iterator[Path]:
+        """Walks the knowledge folder, ChromaDB directories are yielded as a whole and not descended into."""
+        for root, dirs, files in os.walk(self.path):
+            root_path = Path(root)
+
+            for name in list(dirs):
+                if name.lower() == "chromadb":
+                    dirs.remove(name)
+                    yield root_path / name
+
+            for name in sorted(files):
+                yield root_path / name
+
+            if not self.recursive:
+                return
+
+    def _parse_heavy_files(self, heavy_files: List[Tuple[Path, Type[BaseFileKnowledgeSource]]]) -> Iterator:
+        """Parses CPU heavy files on a process pool, a single file is left to be parsed in this process."""
+        if len(heavy_files) < 2:
+            for full_path, source_class in heavy_files:
+                yield self._indexed_source(full_path, source_class, [])
+            return
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(_parse_in_worker, source_class, full_path): (full_path, source_class)
+                for full_path, source_class in heavy_files
+            }
+            for future in as_completed(futures):
+                full_path, source_class = futures[future]
+                print(f"📄 Parsed: {full_path.name}")
+                yield self._indexed_source(full_path, source_class, [], chunks=future.result())
+
+    def _indexed_source(self, full_path: Path, source_class: Type[BaseFileKnowledgeSource], chunk_ids: List[str], chunks: Optional[List[str]] = None) -> IndexedFileKnowledgeSource:
+        return IndexedFileKnowledgeSource(
+            file_path=full_path,
+            source_class=source_class,
+            chunk_ids=chunk_ids,
+            chunks=chunks or [],
+            manifest=self.manifest,
+        )
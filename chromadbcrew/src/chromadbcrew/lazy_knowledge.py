@@ -0,0 +1,74 @@
+from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+import threading
+
+
+class LazyKnowledgeStorage(KnowledgeStorage):
+    """Knowledge storage that opens its Chroma client and adds deferred sources on the first search."""
+
+    def __init__(self, embedder: Optional[Dict[str, Any]] = None, collection_name: Optional[str] = None):
+        super().__init__(embedder=embedder, collection_name=collection_name)
+        self._lock = threading.RLock()
+        self._initialized = False
+        self._pending: List[Callable[[], None]] = []
+
+    def initialize_knowledge_storage(self):
+        """Called by Knowledge at agent creation, the client is opened on first use instead."""
+
+    def defer(self, load: Callable[[], None]) -> None:
+        """Queues a source load until the storage is first queried."""
+        with self._lock:
+            self._pending.append(load)
+
+    def search(self, query: List[str], limit: int = 3, filter: Optional[dict] = None, score_threshold: float = 0.35) -> List[Dict[str, Any]]:
+        self._load_pending()
+        return super().search(query, limit, filter, score_threshold)
+
+    def save(self, documents: List[str], metadata: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None):
+        self._ensure_initialized()
+        return super().save(documents, metadata)
+
+    def _ensure_initialized(self) -> None:
+        with self._lock:
+            if not self._initialized:
+                super().initialize_knowledge_storage()
+                self._initialized = True
+
+    def _load_pending(self) -> None:
+        with self._lock:
+            self._ensure_initialized()
+            while self._pending:
+                self._pending.pop(0)()
+
+
+class LazyKnowledgeSource(BaseKnowledgeSource):
+    """Proxy that builds the real knowledge source(s) only when they are needed.
+
+    With a LazyKnowledgeStorage the sources are built, parsed and embedded on the
+    agent's first knowledge query, otherwise when the agent attaches its knowledge.
+    The factory may return a generator, each source is then added as soon as it is yielded.
+    """
+
+    factory: Callable[[], Union[BaseKnowledgeSource, Iterable[BaseKnowledgeSource]]]
+
+    def validate_content(self):
+        """Nothing to validate until the sources are built."""
+
+    def add(self) -> None:
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+
+        if isinstance(self.storage, LazyKnowledgeStorage):
+            self.storage.defer(self._load)
+        else:
+            self._load()
+
+    def _load(self) -> None:
+        sources = self.factory()
+        if isinstance(sources, BaseKnowledgeSource):
+            sources = [sources]
+
+        for source in sources:
+            source.storage = self.storage
+            source.add()
@@ -0,0 +1,294 @@
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.utilities.paths import db_storage_path
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+import json
+import os
+import shutil
+import sqlite3
+import threading
+
+
+class NumpyVectorIndex:
+    """Vector index stored as a memory-mapped float32 .npy matrix next to a SQLite id and metadata table.
+
+    Row i of vectors.npy belongs to the record with row = i in records.sqlite3.
+    Vectors are stored L2-normalised, so a dot product is the cosine similarity.
+    The matrix is opened with mmap_mode="r", every process reading the same index
+    shares it through the OS page cache. Writes rewrite the matrix, so this is
+    meant for knowledge that is built once and queried many times.
+
+    The methods mirror the parts of a Chroma collection the knowledge sources use
+    (count, get, upsert, delete, query).
+    """
+
+    def __init__(self, path: Path, embedding_function: Optional[Callable[[List[str]], Any]] = None, block_rows: int = 65536):
+        self.path = Path(path)
+        self.embedding_function = embedding_function
+        self.block_rows = block_rows
+        self.vectors_path = self.path / "vectors.npy"
+        self._vectors: Optional[np.ndarray] = None
+        self._lock = threading.RLock()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path / "records.sqlite3"), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS records (row INTEGER PRIMARY KEY, id TEXT UNIQUE NOT NULL, document TEXT, metadata TEXT)"
+        )
+
+    @classmethod
+    def from_batches(cls, path: Path, total: int, dim: int, batches: Iterable[Tuple[List[str], Any, List[str], List[Optional[Dict[str, Any]]]]]) -> "NumpyVectorIndex":
+        """Builds a new index from (ids, vectors, documents, metadatas) batches without holding all vectors in memory."""
+        index = cls(path)
+        with index._lock:
+            index._close_matrix()
+            index._conn.execute("DELETE FROM records")
+            tmp_path = index.path / "vectors.tmp.npy"
+            matrix = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=(total, dim))
+            row = 0
+            for ids, vectors, documents, metadatas in batches:
+                vectors = cls._normalise(vectors)
+                matrix[row : row + len(ids)] = vectors
+                index._conn.executemany(
+                    "INSERT INTO records (row, id, document, metadata) VALUES (?, ?, ?, ?)",
+                    [
+                        (row + offset, record_id, doc, json.dumps(meta) if meta else None)
+                        for offset, (record_id, doc, meta) in enumerate(zip(ids, documents, metadatas))
+                    ],
+                )
+                row += len(ids)
+            matrix.flush()
+            del matrix
+            os.replace(tmp_path, index.vectors_path)
+            index._conn.commit()
+        return index
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def get(self, ids: Optional[List[str]] = None, include: Sequence[str] = ("documents", "metadatas"), limit: Optional[int] = None, offset: int = 0) -> Dict[str, Any]:
+        """Reads records by id, or a page of all records ordered by row."""
+        with self._lock:
+            if ids is not None:
+                rows = []
+                for start in range(0, len(ids), 500):
+                    batch = ids[start : start + 500]
+                    rows.extend(
+                        self._conn.execute(
+                            f"SELECT row, id, document, metadata FROM records WHERE id IN ({','.join('?' * len(batch))}) ORDER BY row",
+                            batch,
+                        ).fetchall()
+                    )
+            else:
+                rows = self._conn.execute(
+                    "SELECT row, id, document, metadata FROM records ORDER BY row LIMIT ? OFFSET ?",
+                    (-1 if limit is None else limit, offset),
+                ).fetchall()
+            return self._records(rows, include)
+
+    def upsert(self, ids: List[str], embeddings: Optional[Any] = None, documents: Optional[List[str]] = None, metadatas: Optional[List[Optional[Dict[str, Any]]]] = None) -> None:
+        """Inserts new records and overwrites existing ones, embedding the documents when no vectors are given."""
+        if embeddings is None:
+            if self.embedding_function is None or documents is None:
+                raise ValueError("Either embeddings or documents and an embedding function are required.")
+            embeddings = self.embedding_function(documents)
+
+        vectors = self._normalise(embeddings)
+        documents = documents or [None] * len(ids)
+        metadatas = metadatas or [None] * len(ids)
+
+        with self._lock:
+            shape = self._shape()
+            size = 0 if shape is None else shape[0]
+            if shape is not None and shape[1] != vectors.shape[1]:
+                raise ValueError(f"Embedding dimension {vectors.shape[1]} does not match the index dimension {shape[1]}.")
+
+            existing = {}
+            for start in range(0, len(ids), 500):
+                batch = ids[start : start + 500]
+                existing.update(
+                    self._conn.execute(f"SELECT id, row FROM records WHERE id IN ({','.join('?' * len(batch))})", batch).fetchall()
+                )
+
+            rows = []
+            for record_id in ids:
+                if record_id not in existing:
+                    existing[record_id] = size
+                    size += 1
+                rows.append(existing[record_id])
+
+            def fill(matrix: np.ndarray) -> None:
+                matrix[rows] = vectors
+
+            self._rewrite(size, vectors.shape[1], fill, keep=None)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO records (row, id, document, metadata) VALUES (?, ?, ?, ?)",
+                [
+                    (row, record_id, doc, json.dumps(meta) if meta else None)
+                    for row, record_id, doc, meta in zip(rows, ids, documents, metadatas)
+                ],
+            )
+            self._conn.commit()
+
+    def delete(self, ids: List[str]) -> None:
+        """Removes records and compacts the matrix."""
+        with self._lock:
+            removed = {
+                row
+                for start in range(0, len(ids), 500)
+                for (row,) in self._conn.execute(
+                    f"SELECT row FROM records WHERE id IN ({','.join('?' * len(ids[start : start + 500]))})",
+                    ids[start : start + 500],
+                )
+            }
+            shape = self._shape()
+            if not removed or shape is None:
+                return
+
+            keep = np.setdiff1d(np.arange(shape[0]), np.fromiter(removed, dtype=np.int64))
+            self._rewrite(len(keep), shape[1], None, keep=keep)
+
+            self._conn.executemany("DELETE FROM records WHERE row = ?", [(row,) for row in removed])
+            # Ascending order never collides with a row number that is still in use
+            self._conn.executemany(
+                "UPDATE records SET row = ? WHERE row = ?",
+                [(new_row, int(old_row)) for new_row, old_row in enumerate(keep) if new_row != old_row],
+            )
+            self._conn.commit()
+
+    def query(self, query_embeddings: Any, n_results: int = 3) -> Dict[str, List[List[Any]]]:
+        """Top-k cosine similarity search, scanning the matrix in blocks of block_rows with one matmul per block."""
+        queries = self._normalise(query_embeddings)
+        result: Dict[str, List[List[Any]]] = {"ids": [], "documents": [], "metadatas": [], "scores": []}
+
+        with self._lock:
+            matrix = self._matrix()
+            if matrix is None or matrix.shape[0] == 0:
+                for key in result:
+                    result[key] = [[] for _ in queries]
+                return result
+
+            k = min(n_results, matrix.shape[0])
+            best_scores = np.full((len(queries), 0), -np.inf, dtype=np.float32)
+            best_rows = np.zeros((len(queries), 0), dtype=np.int64)
+
+            for start in range(0, matrix.shape[0], self.block_rows):
+                scores = queries @ matrix[start : start + self.block_rows].T
+                rows = np.broadcast_to(np.arange(start, start + scores.shape[1]), scores.shape)
+
+                scores = np.concatenate([best_scores, scores], axis=1)
+                rows = np.concatenate([best_rows, rows], axis=1)
+                if scores.shape[1] > k:
+                    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                    scores = np.take_along_axis(scores, top, axis=1)
+                    rows = np.take_along_axis(rows, top, axis=1)
+                best_scores, best_rows = scores, rows
+
+            order = np.argsort(-best_scores, axis=1)
+            best_scores = np.take_along_axis(best_scores, order, axis=1)
+            best_rows = np.take_along_axis(best_rows, order, axis=1)
+
+            for scores, rows in zip(best_scores, best_rows):
+                records = self._records(
+                    self._conn.execute(
+                        f"SELECT row, id, document, metadata FROM records WHERE row IN ({','.join('?' * len(rows))})",
+                        [int(row) for row in rows],
+                    ).fetchall(),
+                    ("documents", "metadatas"),
+                )
+                by_row = dict(zip(records["rows"], zip(records["ids"], records["documents"], records["metadatas"])))
+                hits = [by_row[int(row)] for row in rows]
+                result["ids"].append([hit[0] for hit in hits])
+                result["documents"].append([hit[1] for hit in hits])
+                result["metadatas"].append([hit[2] for hit in hits])
+                result["scores"].append([float(score) for score in scores])
+
+        return result
+
+    def _matrix(self) -> Optional[np.ndarray]:
+        if self._vectors is None and self.vectors_path.exists():
+            self._vectors = np.load(self.vectors_path, mmap_mode="r")
+        return self._vectors
+
+    def _shape(self) -> Optional[Tuple[int, int]]:
+        """Shape of the matrix, without keeping the mapping referenced: _rewrite has to release it."""
+        matrix = self._matrix()
+        return None if matrix is None else matrix.shape
+
+    def _close_matrix(self) -> None:
+        # The mapping has to be released before the file is replaced, Windows refuses otherwise
+        self._vectors = None
+
+    def _rewrite(self, size: int, dim: int, fill: Optional[Callable[[np.ndarray], None]], keep: Optional[np.ndarray]) -> None:
+        """Writes a new matrix of size rows through a temp file, copying the current rows block by block."""
+        current = self._matrix()
+        tmp_path = self.path / "vectors.tmp.npy"
+        matrix = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=(size, dim))
+
+        if current is not None:
+            source_rows = current.shape[0] if keep is None else len(keep)
+            for start in range(0, source_rows, self.block_rows):
+                end = min(start + self.block_rows, source_rows)
+                matrix[start:end] = current[start:end] if keep is None else current[keep[start:end]]
+
+        if fill is not None:
+            fill(matrix)
+
+        matrix.flush()
+        del matrix
+        self._close_matrix()
+        del current
+        os.replace(tmp_path, self.vectors_path)
+
+    @staticmethod
+    def _records(rows: List[Tuple[int, str, Optional[str], Optional[str]]], include: Sequence[str]) -> Dict[str, Any]:
+        records: Dict[str, Any] = {"rows": [row[0] for row in rows], "ids": [row[1] for row in rows]}
+        if "documents" in include:
+            records["documents"] = [row[2] for row in rows]
+        if "metadatas" in include:
+            records["metadatas"] = [json.loads(row[3]) if row[3] else None for row in rows]
+        return records
+
+    @staticmethod
+    def _normalise(vectors: Any) -> np.ndarray:
+        matrix = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+
+class NumpyKnowledgeStorage(KnowledgeStorage):
+    """Knowledge storage backed by a NumpyVectorIndex instead of chroma.sqlite3, for read-heavy knowledge bases.
+
+    Example:
+        Agent(..., knowledge_storage=NumpyKnowledgeStorage(embedder=embedder, collection_name="knowledge_agent"))
+    """
+
+    def __init__(self, embedder: Optional[Dict[str, Any]] = None, collection_name: Optional[str] = None, path: Optional[Path] = None):
+        super().__init__(embedder=embedder, collection_name=collection_name)
+        self.path = Path(path) if path else Path(db_storage_path()) / "knowledge_npy"
+
+    def initialize_knowledge_storage(self):
+        collection_name = f"knowledge_{self.collection_name}" if self.collection_name else "knowledge"
+        self.collection = NumpyVectorIndex(self.path / collection_name, embedding_function=self.embedder)
+
+    def search(self, query: List[str], limit: int = 3, filter: Optional[dict] = None, score_threshold: float = 0.35) -> List[Dict[str, Any]]:
+        """Returns the chunks with a cosine similarity of at least score_threshold to the first query."""
+        if not self.collection:
+            raise Exception("Collection not initialized")
+        if filter:
+            raise ValueError("Metadata filters are not supported by the NumPy knowledge storage.")
+
+        fetched = self.collection.query(self.embedder(query), n_results=limit)
+        results = []
+        for record_id, metadata, document, score in zip(
+            fetched["ids"][0], fetched["metadatas"][0], fetched["documents"][0], fetched["scores"][0]
+        ):
+            if score >= score_threshold:
+                results.append({"id": record_id, "metadata": metadata, "context": document, "score": score})
+        return results
+
+    def reset(self):
+        if self.path.exists():
+            shutil.rmtree(self.path)
+        self.collection = None
@@ -0,0 +1,94 @@
+# Run with `uv run --with pytest pytest tests`
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+
+# Seconds importing chromadbcrew.crew may take on top of crewai and chromadb themselves
+IMPORT_BUDGET_SECONDS = float(os.getenv("IMPORT_BUDGET_SECONDS", "1.0"))
+
+# Runs in a fresh interpreter: imports the dependencies, installs spies on directory listing,
+# Chroma clients and embedders, then times the import of the crew module
+_PROBE = r"""
+import json, os, time
+
+import chromadb
+import crewai
+from crewai.utilities.embedding_configurator import EmbeddingConfigurator
+
+events = []
+knowledge = os.path.abspath("knowledge")
+
+def spy_listing(name):
+    original = getattr(os, name)
+    def listing(path=".", *args, **kwargs):
+        if os.path.abspath(os.fspath(path)).startswith(knowledge):
+            events.append(f"scan: os.{name}({os.fspath(path)!r})")
+        return original(path, *args, **kwargs)
+    setattr(os, name, listing)
+
+for name in ("walk", "scandir", "listdir"):
+    spy_listing(name)
+
+def spy_client(name):
+    def client(*args, **kwargs):
+        events.append(f"chroma: chromadb.{name}()")
+        raise RuntimeError(f"chromadb.{name} started during import")
+    setattr(chromadb, name, client)
+
+for name in ("Client", "PersistentClient", "EphemeralClient", "HttpClient"):
+    if hasattr(chromadb, name):
+        spy_client(name)
+
+configure_embedder = EmbeddingConfigurator.configure_embedder
+def spy_embedder(self, *args, **kwargs):
+    events.append("embedder: EmbeddingConfigurator.configure_embedder()")
+    return configure_embedder(self, *args, **kwargs)
+EmbeddingConfigurator.configure_embedder = spy_embedder
+
+start = time.perf_counter()
+import chromadbcrew.crew
+seconds = time.perf_counter() - start
+print(json.dumps({"seconds": seconds, "events": events}))
+"""
+
+
+@pytest.fixture(scope="module", params=["local", "shared_store"])
+def crew_import(request, tmp_path_factory):
+    """Imports chromadbcrew.crew in a subprocess, with and without the shared knowledge store."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_DIR / "src"), env.get("PYTHONPATH")]))
+    env.pop("CREWAI_SHARED_KNOWLEDGE_DIR", None)
+    if request.param == "shared_store":
+        env["CREWAI_SHARED_KNOWLEDGE_DIR"] = str(tmp_path_factory.mktemp("shared_knowledge"))
+
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=PROJECT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_does_not_scan_knowledge(crew_import):
+    assert [event for event in crew_import["events"] if event.startswith("scan:")] == []
+
+
+def test_import_starts_no_chroma_client_or_embedder(crew_import):
+    assert [event for event in crew_import["events"] if not event.startswith("scan:")] == []
+
+
+def test_import_within_budget(crew_import):
+    assert crew_import["seconds"] < IMPORT_BUDGET_SECONDS, (
+        f"importing chromadbcrew.crew took {crew_import['seconds']:.2f}s, budget {IMPORT_BUDGET_SECONDS}s"
+    )
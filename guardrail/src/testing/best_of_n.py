@@ -0,0 +1,191 @@
+import datetime
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, List, Optional, Tuple
+
+from crewai import Task
+from crewai.agents.agent_builder.base_agent import BaseAgent
+from crewai.tasks.guardrail_result import GuardrailResult
+from crewai.tasks.task_output import TaskOutput
+from crewai.utilities.printer import Printer
+from pydantic import Field
+
+from testing.streaming import GenerationCancelled
+
+
+class BestOfNTask(Task):
+    """Task that generates several candidates at once and keeps the first one passing its guardrail.
+
+    With candidates=N each round runs N copies of the agent concurrently and
+    checks every result with the guardrail as soon as it arrives. The first
+    passing candidate is the task output and the others are cancelled: agents
+    whose LLM has a cancel_event (GuardedStreamingLLM) stop streaming at the
+    next chunk, any other running candidate finishes in the background and is
+    discarded. Only when all N fail does the task retry, with the first error
+    as feedback, so max_retries counts rounds of N instead of single drafts.
+
+    Without a guardrail, or with candidates=1, it behaves like a plain Task.
+    """
+
+    candidates: int = Field(
+        default=1,
+        ge=1,
+        description="Candidate generations launched at once, the first one passing the guardrail wins",
+    )
+
+    def _execute_core(
+        self,
+        agent: Optional[BaseAgent],
+        context: Optional[str],
+        tools: Optional[List[Any]],
+    ) -> TaskOutput:
+        if self.candidates <= 1 or not self.guardrail:
+            return super()._execute_core(agent, context, tools)
+
+        agent = agent or self.agent
+        self.agent = agent
+        if not agent:
+            raise Exception(
+                f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Crew using a specific process that support that, like hierarchical."
+            )
+
+        self.start_time = datetime.datetime.now()
+        self._execution_span = self._telemetry.task_started(crew=agent.crew, task=self)
+
+        self.prompt_context = context
+        tools = tools or self.tools or []
+
+        self.processed_by_agents.add(agent.role)
+
+        winner, errors = self._race(agent, context, tools)
+        if winner is None:
+            if self.retry_count >= self.max_retries:
+                raise Exception(
+                    f"Task failed guardrail validation for all {self.candidates} candidates after {self.max_retries} retries. "
+                    f"Last error: {errors[0][0].error}"
+                )
+
+            self.retry_count += 1
+            guardrail_result, task_output = errors[0]
+            context = self.i18n.errors("validation_error").format(
+                guardrail_result_error=guardrail_result.error,
+                task_output=task_output.raw,
+            )
+            Printer().print(
+                content=f"Guardrail blocked all {self.candidates} candidates, retrying, due to: {guardrail_result.error}\n",
+                color="yellow",
+            )
+            return self._execute_core(agent, context, tools)
+
+        guardrail_result, task_output = winner
+        if guardrail_result.result is None:
+            raise Exception(
+                "Task guardrail returned None as result. This is not allowed."
+            )
+
+        if isinstance(guardrail_result.result, str):
+            task_output.raw = guardrail_result.result
+            task_output.pydantic, task_output.json_dict = self._export_output(guardrail_result.result)
+        elif isinstance(guardrail_result.result, TaskOutput):
+            task_output = guardrail_result.result
+
+        self.output = task_output
+        self.end_time = datetime.datetime.now()
+
+        if self.callback:
+            self.callback(self.output)
+
+        if self._execution_span:
+            self._telemetry.task_ended(self._execution_span, self, agent.crew)
+            self._execution_span = None
+
+        if self.output_file:
+            content = (
+                task_output.json_dict
+                if task_output.json_dict
+                else task_output.pydantic.model_dump_json()
+                if task_output.pydantic
+                else task_output.raw
+            )
+            self._save_file(content)
+
+        return task_output
+
+    def _race(
+        self,
+        agent: BaseAgent,
+        context: Optional[str],
+        tools: List[Any],
+    ) -> Tuple[Optional[Tuple[GuardrailResult, TaskOutput]], List[Tuple[GuardrailResult, TaskOutput]]]:
+        """Runs one round of candidates, returns the winner (or None) and the failed verdicts in arrival order."""
+        cancel = threading.Event()
+        errors: List[Tuple[GuardrailResult, TaskOutput]] = []
+        crashes: List[BaseException] = []
+
+        executor = ThreadPoolExecutor(max_workers=self.candidates, thread_name_prefix="best-of-n")
+        try:
+            pending = {
+                executor.submit(self._candidate, agent, context, tools, cancel)
+                for _ in range(self.candidates)
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is not None:
+                        crashes.append(future.exception())
+                        continue
+                    guardrail_result, task_output = future.result()
+                    if guardrail_result.success:
+                        cancel.set()
+                        return (guardrail_result, task_output), errors
+                    errors.append((guardrail_result, task_output))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if not errors:
+            # Every candidate crashed, surface the error like a single execution would
+            raise crashes[0]
+        return None, errors
+
+    def _candidate(
+        self,
+        agent: BaseAgent,
+        context: Optional[str],
+        tools: List[Any],
+        cancel: threading.Event,
+    ) -> Tuple[GuardrailResult, TaskOutput]:
+        # Agents keep per-execution state (executor, counters), each candidate gets its own copy
+        candidate = agent.copy()
+        candidate.crew = agent.crew
+        if hasattr(candidate.llm, "cancel_event"):
+            candidate.llm.cancel_event = cancel
+
+        # Agent.execute_task retries on any error, a cancelled loser would open new streams
+        # only to cancel them again. The retries happen here instead, while nobody has won.
+        retries = getattr(candidate, "max_retry_limit", 0)
+        if retries:
+            candidate.max_retry_limit = 0
+        for attempt in range(retries + 1):
+            if cancel.is_set():
+                raise GenerationCancelled("Another candidate passed the guardrail")
+            try:
+                result = candidate.execute_task(task=self, context=context, tools=tools)
+                break
+            except GenerationCancelled:
+                raise
+            except Exception as e:
+                if attempt == retries or e.__class__.__module__.startswith("litellm"):
+                    raise
+
+        pydantic_output, json_output = self._export_output(result)
+        task_output = TaskOutput(
+            name=self.name,
+            description=self.description,
+            expected_output=self.expected_output,
+            raw=result,
+            pydantic=pydantic_output,
+            json_dict=json_output,
+            agent=agent.role,
+            output_format=self._get_output_format(),
+        )
+        return GuardrailResult.from_tuple(self.guardrail(task_output)), task_output
@@ -1,8 +1,14 @@
 from crewai import Agent, Crew, Process, Task
-from crewai.project import CrewBase, agent, crew, task
+from crewai.project import CrewBase, agent, crew, task, after_kickoff
 from typing import Tuple, Union, Dict, Any
 from pydantic import BaseModel, Field
 import json
+import logging
+import os
+from testing.best_of_n import BestOfNTask
+from testing.guardrails import GuardrailChain, GuardrailStep
+from testing.repair import RepairingGuardrail, extract_json, strip_code_fences, trim_words
+from testing.streaming import GuardedStreamingLLM, JSONPrefixGuard, WordLimitGuard
 
 # If you want to run a snippet of code before or after the crew starts, 
 # you can use the @before_kickoff and @after_kickoff decorators
@@ -37,53 +43,65 @@ def validate_blog_content(result: str) -> Tuple[bool, Any]:
 			"code": "SYSTEM_ERROR"
 		}))
 
-class BlogValidationError(Exception):
-    """Blog content error"""
-    def __init__(self, message):
-        super().__init__(message)
-
+def check_not_empty(blog: str) -> Tuple[bool, Any]:
+	"""Rejects empty output."""
+	if not blog.strip():
+		return (False, json.dumps({
+			"error": "Empty result",
+			"code": "EMPTY_INPUT"
+		}))
+	return (True, blog)
 
-def validate_content(blog: str):
-	print(blog)
+def check_word_count(blog: str) -> Tuple[bool, Any]:
+	"""Rejects blogs over 150 words."""
 	word_count = len(blog.split())
-	print(word_count)
 	if word_count > 150:
-		raise BlogValidationError(json.dumps({
+		return (False, json.dumps({
 			"error": "Blog content exceeds 150 words",
 			"code": "WORD_COUNT_ERROR",
 			"context": {"word_count": word_count}
 		}))
-	return blog
-
-def format_output(blog: str):
-	data = json.loads(blog)
-	return blog
-
-def complex_validation(result: str) -> Tuple[bool, Any]:
-	"""Chain multiple validation steps."""
-	# Step 1: Basic validation
-	if not result:
-		return (False, json.dumps({
-			"error": "Empty result",
-			"code": "EMPTY_INPUT"
-		}))
+	return (True, blog)
 
-	# Step 2: Content validation
-	blog = result.raw
+def check_json_format(blog: str) -> Tuple[bool, Any]:
+	"""Rejects blogs that are not valid JSON."""
 	try:
-		validated = validate_content(blog)
-  
-		# Step 3: Format validation
-		formatted = format_output(validated)
-		return (True, {"blog": formatted})
-	except BlogValidationError as e:
-		return (False, f"{e}")
+		json.loads(blog)
 	except json.JSONDecodeError as e:
 		return (False, json.dumps({
 			"error": "Invalid JSON format",
 			"code": "JSON_ERROR",
 			"context": {"line": e.lineno, "column": e.colno}
 		}))
+	return (True, blog)
+
+# Cheapest checks first, the chain stops at the first failure and remembers verdicts by output hash
+complex_validation = GuardrailChain(
+	GuardrailStep("not_empty", check_not_empty, cost=0),
+	GuardrailStep("word_count", check_word_count, cost=1),
+	GuardrailStep("json_format", check_json_format, cost=10),
+	name="complex_validation",
+	result=lambda blog: {"blog": blog},
+)
+
+# Mechanical fixes tried on a rejected blog before the LLM is asked again
+repaired_validation = RepairingGuardrail(
+	complex_validation,
+	strip_code_fences,
+	extract_json,
+	trim_words(150),
+	name="complex_validation",
+)
+
+# The checks run while the answer streams, the generation is cut as soon as the
+# JSON document is broken beyond repair or the answer runs far past the limit.
+# Fences and prose around the document and a draft somewhat over 150 words are
+# left to repaired_validation, cutting those mid-stream would leave it only a
+# truncated draft to fix.
+blog_writer_llm = GuardedStreamingLLM(
+	model=os.getenv("MODEL", "gpt-4o-mini"),
+	guards=[WordLimitGuard(max_words=300), JSONPrefixGuard(lenient=True)],
+)
 
 class BlogPost(BaseModel):
 	Description: str = Field(contect="Blog post content")
@@ -99,20 +117,33 @@ class Testing():
 	def blog_writer(self) -> Agent:
 		return Agent(
 			config=self.agents_config['blog_writer'],
+			llm=blog_writer_llm,
 			verbose=True
 		)
 
 	@task
 	def blog_writer_task(self) -> Task:
-		return Task(
+		# Drafts are generated BLOG_CANDIDATES at a time, the first one passing the guardrail wins
+		return BestOfNTask(
 			config=self.tasks_config['blog_writer_task'],
 			output_file='outputs/blog_post.json',
-			guardrail=complex_validation,
+			guardrail=repaired_validation,
 			output_pydantic=BlogPost,
-			max_retries=3 #default
+			max_retries=3, #default
+			candidates=int(os.getenv("BLOG_CANDIDATES", "3")),
 		)
 
 
+	@after_kickoff
+	def report_guardrail_stats(self, output):
+		logging.getLogger(__name__).info("Guardrail stats: %s", json.dumps(complex_validation.stats()))
+		logging.getLogger(__name__).info("Guardrail repairs: %s", json.dumps(repaired_validation.stats()))
+		logging.getLogger(__name__).info(
+			"Streams aborted early: %d, completed: %d, cancelled: %d",
+			blog_writer_llm.aborted, blog_writer_llm.completed, blog_writer_llm.cancelled
+		)
+		return output
+
 	@crew
 	def crew(self) -> Crew:
 		"""Creates the Testing crew"""
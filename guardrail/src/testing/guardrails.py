@@ -0,0 +1,160 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GuardrailStep:
+    """One check of a GuardrailChain.
+
+    check gets the value produced by the previous step (the raw output for the
+    first one) and returns (True, value for the next step) or (False, error).
+    Steps run from the lowest cost up, so cheap checks like a word count reject
+    bad outputs before expensive ones like JSON parsing run.
+    """
+
+    name: str
+    check: Callable[[Any], Tuple[bool, Any]]
+    cost: int = 0
+
+
+@dataclass
+class StepStats:
+    calls: int = 0
+    passed: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class ChainStats:
+    calls: int = 0
+    cache_hits: int = 0
+    passed: int = 0
+    failed: int = 0
+    steps: Dict[str, StepStats] = field(default_factory=dict)
+
+
+class GuardrailChain:
+    """Declarative task guardrail, usable as Task(guardrail=GuardrailChain(...)).
+
+    - steps run cheapest first and the chain stops at the first failure
+    - verdicts are memoized by the sha256 of the output, so a retry that produces
+      the same text (or a second task with the same output) is not checked again
+    - per-step timing and pass/fail counters are kept in stats(), and every
+      verdict is passed to on_verdict and logged on the module logger
+    """
+
+    def __init__(
+        self,
+        *steps: GuardrailStep,
+        name: str = "guardrail",
+        result: Optional[Callable[[Any], Any]] = None,
+        cache_size: int = 1024,
+        on_verdict: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.name = name
+        # sorted() is stable, steps with the same cost keep their declared order
+        self.steps: List[GuardrailStep] = sorted(steps, key=lambda step: step.cost)
+        self.result = result
+        self.cache_size = cache_size
+        self.on_verdict = on_verdict
+        self._stats = ChainStats(steps={step.name: StepStats() for step in self.steps})
+        # Output hash -> (verdict, name of the failed step)
+        self._cache: "OrderedDict[str, Tuple[Tuple[bool, Any], Optional[str]]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __call__(self, output: Any) -> Tuple[bool, Any]:
+        text = output.raw if hasattr(output, "raw") else str(output)
+        key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+        with self._lock:
+            self._stats.calls += 1
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._stats.cache_hits += 1
+                verdict, failed_step = self._cache[key]
+                self._record(verdict, failed_step=failed_step, cached=True)
+                return verdict
+
+        verdict, failed_step, timings = self._run(text)
+
+        with self._lock:
+            self._cache[key] = (verdict, failed_step)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            for step_name, (passed, seconds) in timings.items():
+                step_stats = self._stats.steps[step_name]
+                step_stats.calls += 1
+                step_stats.seconds += seconds
+                if passed:
+                    step_stats.passed += 1
+                else:
+                    step_stats.failed += 1
+            self._record(verdict, failed_step=failed_step, cached=False, timings=timings)
+        return verdict
+
+    def _run(self, text: str) -> Tuple[Tuple[bool, Any], Optional[str], Dict[str, Tuple[bool, float]]]:
+        value: Any = text
+        timings: Dict[str, Tuple[bool, float]] = {}
+
+        for step in self.steps:
+            start = time.perf_counter()
+            try:
+                passed, value = step.check(value)
+            except Exception as e:
+                # A crashing check fails the output instead of the task
+                passed, value = False, f"{step.name} raised {type(e).__name__}: {e}"
+            timings[step.name] = (passed, time.perf_counter() - start)
+            if not passed:
+                return (False, value), step.name, timings
+
+        return (True, self.result(value) if self.result else value), None, timings
+
+    def _record(self, verdict: Tuple[bool, Any], failed_step: Optional[str], cached: bool, timings: Optional[Dict[str, Tuple[bool, float]]] = None) -> None:
+        if verdict[0]:
+            self._stats.passed += 1
+        else:
+            self._stats.failed += 1
+
+        event = {
+            "guardrail": self.name,
+            "passed": verdict[0],
+            "failed_step": failed_step,
+            "cached": cached,
+            "timings_ms": {name: seconds * 1000 for name, (_, seconds) in (timings or {}).items()},
+        }
+        logger.debug("guardrail verdict: %s", event)
+        if self.on_verdict:
+            self.on_verdict(event)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters of the chain and of each step, step time in milliseconds."""
+        with self._lock:
+            return {
+                "guardrail": self.name,
+                "calls": self._stats.calls,
+                "cache_hits": self._stats.cache_hits,
+                "passed": self._stats.passed,
+                "failed": self._stats.failed,
+                "steps": {
+                    name: {
+                        "calls": step.calls,
+                        "passed": step.passed,
+                        "failed": step.failed,
+                        "total_ms": step.seconds * 1000,
+                        "mean_ms": step.seconds * 1000 / step.calls if step.calls else 0.0,
+                    }
+                    for name, step in self._stats.steps.items()
+                },
+            }
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,158 @@
+import json
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Fixer = Callable[[str], str]
+
+_FENCE = re.compile(r"```[\w-]*[ \t]*\n?(.*?)\n?[ \t]*```", re.DOTALL)
+
+
+def strip_code_fences(text: str) -> str:
+    """Keeps the content of the first ``` fenced block, e.g. a ```json block around the answer."""
+    match = _FENCE.search(text)
+    return match.group(1).strip() if match else text
+
+
+def extract_json(text: str) -> str:
+    """Keeps the first JSON object or array found in the text, dropping the prose around it."""
+    decoder = json.JSONDecoder()
+    for match in re.finditer(r"[\[{]", text):
+        try:
+            _, end = decoder.raw_decode(text, match.start())
+        except json.JSONDecodeError:
+            continue
+        return text[match.start() : end]
+    return text
+
+
+def trim_words(max_words: int) -> Fixer:
+    """Fixer cutting the text to max_words words.
+
+    A JSON document stays a JSON document: words are dropped from the end of
+    its longest string value until the serialized document is short enough.
+    """
+
+    def fix(text: str) -> str:
+        if len(text.split()) <= max_words:
+            return text
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            return " ".join(text.split()[:max_words])
+
+        strings = _string_slots(data)
+        while strings and len(json.dumps(data, ensure_ascii=False).split()) > max_words:
+            container, key = max(strings, key=lambda slot: len(slot[0][slot[1]].split()))
+            words = container[key].split()
+            if not words:
+                break
+            container[key] = " ".join(words[:-1])
+        return json.dumps(data, ensure_ascii=False)
+
+    fix.__name__ = f"trim_words_{max_words}"
+    return fix
+
+
+def _string_slots(data: Any) -> List[Tuple[Any, Any]]:
+    """(container, key) of every string value of a parsed JSON document."""
+    slots = []
+    items = data.items() if isinstance(data, dict) else enumerate(data) if isinstance(data, list) else []
+    for key, value in items:
+        if isinstance(value, str):
+            slots.append((data, key))
+        else:
+            slots.extend(_string_slots(value))
+    return slots
+
+
+@dataclass
+class RepairStats:
+    failed_outputs: int = 0
+    repaired: int = 0
+    unrepaired: int = 0
+    fixers: Dict[str, int] = field(default_factory=dict)
+
+
+class RepairingGuardrail:
+    """Wraps a task guardrail with a local repair stage, usable as Task(guardrail=RepairingGuardrail(...)).
+
+    When the guardrail rejects an output, the fixers are applied one after the
+    other (each one to the result of the previous) and the guardrail runs again
+    after every fixer that changed the text. The first passing version is the
+    task output, the LLM is only asked again when no fixer helps. Every repaired
+    output is one LLM round trip saved, see stats().
+    """
+
+    def __init__(self, guardrail: Callable[[Any], Tuple[bool, Any]], *fixers: Fixer, name: Optional[str] = None):
+        self.guardrail = guardrail
+        self.fixers = list(fixers)
+        self.name = name or getattr(guardrail, "name", getattr(guardrail, "__name__", "guardrail"))
+        self._stats = RepairStats(fixers={self._fixer_name(fixer): 0 for fixer in self.fixers})
+        self._lock = threading.Lock()
+
+    def __call__(self, output: Any) -> Tuple[bool, Any]:
+        verdict = self.guardrail(output)
+        if verdict[0] or not self.fixers:
+            return verdict
+
+        text = output.raw if hasattr(output, "raw") else str(output)
+        for fixer in self.fixers:
+            try:
+                fixed = fixer(text)
+            except Exception as e:
+                logger.debug("fixer %s raised %s: %s", self._fixer_name(fixer), type(e).__name__, e)
+                continue
+            if fixed == text:
+                continue
+            text = fixed
+
+            repaired = self.guardrail(self._with_text(output, text))
+            if repaired[0]:
+                self._count(fixer=self._fixer_name(fixer))
+                logger.info("%s: output repaired by %s, LLM retry skipped", self.name, self._fixer_name(fixer))
+                value = repaired[1]
+                # The task only replaces its output with a string or a TaskOutput result
+                if not isinstance(value, str) and not hasattr(value, "raw"):
+                    value = text
+                return (True, value)
+
+        self._count(fixer=None)
+        # The original error, it describes what the LLM got wrong
+        return verdict
+
+    def _count(self, fixer: Optional[str]) -> None:
+        with self._lock:
+            self._stats.failed_outputs += 1
+            if fixer is None:
+                self._stats.unrepaired += 1
+            else:
+                self._stats.repaired += 1
+                self._stats.fixers[fixer] += 1
+
+    @staticmethod
+    def _with_text(output: Any, text: str) -> Any:
+        # Guardrails written for TaskOutput (like validate_blog_content) get one back
+        if hasattr(output, "model_copy"):
+            return output.model_copy(update={"raw": text})
+        return text
+
+    @staticmethod
+    def _fixer_name(fixer: Fixer) -> str:
+        return getattr(fixer, "__name__", type(fixer).__name__)
+
+    def stats(self) -> Dict[str, Any]:
+        """Failed outputs seen, how many were repaired (LLM round trips saved) and by which fixer."""
+        with self._lock:
+            return {
+                "guardrail": self.name,
+                "failed_outputs": self._stats.failed_outputs,
+                "repaired": self._stats.repaired,
+                "unrepaired": self._stats.unrepaired,
+                "round_trips_saved": self._stats.repaired,
+                "fixers": dict(self._stats.fixers),
+            }
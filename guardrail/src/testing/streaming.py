@@ -0,0 +1,368 @@
+import copy
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from crewai import LLM
+
+logger = logging.getLogger(__name__)
+
+FINAL_ANSWER = "Final Answer:"
+
+
+class StreamGuard:
+    """Incremental check over streamed LLM output.
+
+    feed() gets every new piece of text and returns an error message once the
+    output can no longer pass, whatever the model writes next. Only the text
+    after the marker (the agent's final answer) is checked, the thoughts before
+    it are free.
+    """
+
+    name = "stream_guard"
+
+    def __init__(self, marker: Optional[str] = FINAL_ANSWER):
+        self.marker = marker
+        self.reset()
+
+    def reset(self) -> None:
+        self._buffer = ""
+        self._started = self.marker is None
+
+    def fresh(self) -> "StreamGuard":
+        """A copy with empty state, one per generation."""
+        guard = copy.copy(self)
+        guard.reset()
+        return guard
+
+    def feed(self, delta: str) -> Optional[str]:
+        if not self._started:
+            self._buffer += delta
+            index = self._buffer.find(self.marker)
+            if index < 0:
+                # Keep just enough to find a marker split across chunks
+                self._buffer = self._buffer[-len(self.marker) :]
+                return None
+            self._started = True
+            delta = self._buffer[index + len(self.marker) :]
+            self._buffer = ""
+        return self.check(delta) if delta else None
+
+    def check(self, delta: str) -> Optional[str]:
+        raise NotImplementedError
+
+
+class WordLimitGuard(StreamGuard):
+    """Aborts as soon as the answer has more than max_words complete words."""
+
+    name = "word_limit"
+
+    def __init__(self, max_words: int = 150, marker: Optional[str] = FINAL_ANSWER):
+        self.max_words = max_words
+        super().__init__(marker)
+
+    def reset(self) -> None:
+        super().reset()
+        self._words = 0
+        self._in_word = False
+
+    def check(self, delta: str) -> Optional[str]:
+        for char in delta:
+            if char.isspace():
+                self._in_word = False
+            elif not self._in_word:
+                self._in_word = True
+                self._words += 1
+                # The word that just started makes max_words + 1 however it ends
+                if self._words > self.max_words:
+                    return f"Answer exceeds {self.max_words} words"
+        return None
+
+
+class JSONPrefixGuard(StreamGuard):
+    """Aborts as soon as the answer can no longer become a valid JSON document.
+
+    A small pushdown scanner tracks objects, arrays, strings and literals, so
+    a leading code fence, prose before the JSON or text after it fail at the
+    first character that makes the document invalid.
+
+    With lenient, text before the first '{' or '[' and after the end of the
+    document is ignored, so fenced or chatty answers keep streaming for a
+    repair step (e.g. testing.repair.extract_json) to clean up. Only a broken
+    document aborts.
+    """
+
+    name = "json_prefix"
+    _LITERALS = ("true", "false", "null")
+    _NUMBER_CHARS = set("0123456789+-.eE")
+
+    def __init__(self, lenient: bool = False, marker: Optional[str] = FINAL_ANSWER):
+        self.lenient = lenient
+        super().__init__(marker)
+
+    def reset(self) -> None:
+        super().reset()
+        self._seeking = self.lenient
+        self._stack: List[str] = []
+        self._expect = "value"  # value, key, colon, comma, done
+        self._allow_close = False
+        self._in_string = False
+        self._escape = False
+        self._literal = ""
+
+    def check(self, delta: str) -> Optional[str]:
+        for char in delta:
+            error = self._step(char)
+            if error:
+                return f"Answer is not valid JSON: {error}"
+        return None
+
+    def _step(self, char: str) -> Optional[str]:
+        if self._seeking:
+            if char not in "{[":
+                return None
+            self._seeking = False
+
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                self._expect = "colon" if self._expect == "key" else self._after_value()
+            return None
+
+        if self._literal:
+            if self._literal[0] in "tfn":
+                candidate = self._literal + char
+                if any(literal.startswith(candidate) for literal in self._LITERALS):
+                    self._literal = candidate if candidate not in self._LITERALS else ""
+                    if not self._literal:
+                        self._expect = self._after_value()
+                    return None
+                return f"unexpected {char!r} in a literal"
+            if char in self._NUMBER_CHARS:
+                return None
+            self._literal = ""
+            self._expect = self._after_value()
+
+        if char.isspace():
+            return None
+
+        if self._expect == "done":
+            return None if self.lenient else f"unexpected {char!r} after the document"
+
+        if self._allow_close and char in "]}":
+            return self._close(char)
+
+        if self._expect in ("value", "key") and char == '"':
+            self._in_string, self._allow_close = True, False
+            return None
+
+        if self._expect == "value":
+            self._allow_close = False
+            if char in "{[":
+                self._stack.append(char)
+                self._expect = "key" if char == "{" else "value"
+                self._allow_close = True
+                return None
+            if char in "tfn-0123456789":
+                self._literal = char
+                return None
+            return f"unexpected {char!r} where a value should start"
+
+        if self._expect == "key":
+            return f"unexpected {char!r} where a key should start"
+
+        if self._expect == "colon":
+            if char == ":":
+                self._expect = "value"
+                return None
+            return f"unexpected {char!r} where ':' should follow a key"
+
+        # Expecting a comma or the end of the container
+        if char == ",":
+            self._expect = "key" if self._stack[-1] == "{" else "value"
+            return None
+        if char in "]}":
+            return self._close(char)
+        return f"unexpected {char!r} where ',' or the end of a container should follow"
+
+    def _close(self, char: str) -> Optional[str]:
+        if not self._stack or {"{": "}", "[": "]"}[self._stack[-1]] != char:
+            return f"mismatched {char!r}"
+        self._stack.pop()
+        self._allow_close = False
+        self._expect = self._after_value()
+        return None
+
+    def _after_value(self) -> str:
+        self._allow_close = False
+        return "comma" if self._stack else "done"
+
+
+class GenerationCancelled(Exception):
+    """Raised from GuardedStreamingLLM.call when its cancel_event is set mid-stream."""
+
+
+def litellm_stream(params: Dict[str, Any]) -> Iterable[Any]:
+    """Default stream function, yields the text deltas of a streamed litellm completion, then its usage."""
+    import litellm
+
+    for chunk in litellm.completion(**{**params, "stream": True, "stream_options": {"include_usage": True}}):
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            yield delta
+        usage = getattr(chunk, "usage", None)
+        if usage:
+            yield usage
+
+
+def estimate_usage(params: Dict[str, Any], text: str) -> Any:
+    """Token usage of a generation the provider did not report, e.g. one closed mid-stream."""
+    import litellm
+    from litellm.types.utils import Usage
+
+    prompt_tokens = litellm.token_counter(model=params["model"], messages=params["messages"])
+    completion_tokens = litellm.token_counter(model=params["model"], text=text) if text else 0
+    return Usage(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, total_tokens=prompt_tokens + completion_tokens)
+
+
+def fake_stream(text: str, chunk_size: int = 4, delay: float = 0.0) -> Callable[[Dict[str, Any]], Iterator[str]]:
+    """Stream function replaying a canned answer in small chunks, to exercise the guards without a model.
+
+    consumed counts the chunks that were actually pulled, so a test can check
+    that the generation stopped early.
+    """
+
+    def stream(params: Dict[str, Any]) -> Iterator[str]:
+        for start in range(0, len(text), chunk_size):
+            if delay:
+                time.sleep(delay)
+            stream.consumed += 1
+            yield text[start : start + chunk_size]
+
+    stream.consumed = 0
+    return stream
+
+
+class GuardedStreamingLLM(LLM):
+    """LLM that streams its answer through StreamGuards and cuts the generation at the first certain violation.
+
+    The text generated so far is returned as the answer, it already fails the
+    task guardrail, so crewAI moves straight to the retry instead of waiting
+    for a full over-length draft. Calls with tools are not streamed.
+
+    stream_fn takes the completion parameters and yields text deltas, pass a
+    fake one to run without a model, e.g. stream_fn=fake_stream("Final Answer: ...").
+    Anything else it yields is taken as the usage of the completion. Like
+    LLM.call, the callbacks are registered with litellm and get the usage
+    through log_success_event, so the agent's token counts include streamed
+    answers. Cut or cancelled generations, which end before the provider
+    reports usage, are counted with estimate_usage.
+    """
+
+    def __init__(self, model: str, guards: Optional[List[StreamGuard]] = None, stream_fn: Optional[Callable[[Dict[str, Any]], Iterable[str]]] = None, **kwargs):
+        super().__init__(model=model, **kwargs)
+        self.guards = guards or []
+        self.stream_fn = stream_fn or litellm_stream
+        # Set by whoever no longer needs the answer (e.g. BestOfNTask), the stream is closed at the next chunk
+        self.cancel_event: Optional[threading.Event] = None
+        # Shared with shallow copies (Agent.copy), so the counters cover every copy
+        self._stats = {"aborted": 0, "completed": 0, "cancelled": 0}
+        self._stats_lock = threading.Lock()
+
+    @property
+    def aborted(self) -> int:
+        return self._stats["aborted"]
+
+    @property
+    def completed(self) -> int:
+        return self._stats["completed"]
+
+    @property
+    def cancelled(self) -> int:
+        return self._stats["cancelled"]
+
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            self._stats[counter] += 1
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        if tools and available_functions:
+            return super().call(messages, tools, callbacks, available_functions)
+
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+
+        params = {
+            "model": self.model,
+            "messages": messages,
+            "timeout": self.timeout,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "stop": self.stop,
+            "max_tokens": self.max_tokens or self.max_completion_tokens,
+            "api_base": self.api_base,
+            "base_url": self.base_url,
+            "api_version": self.api_version,
+            "api_key": self.api_key,
+            **self.additional_params,
+        }
+        params = {key: value for key, value in params.items() if value is not None}
+
+        if callbacks:
+            self.set_callbacks(callbacks)
+
+        guards = [guard.fresh() for guard in self.guards]
+        parts: List[str] = []
+        usage = None
+        stream = iter(self.stream_fn(params))
+        try:
+            for delta in stream:
+                if not isinstance(delta, str):
+                    usage = delta
+                    continue
+                if self.cancel_event is not None and self.cancel_event.is_set():
+                    self._count("cancelled")
+                    self._log_usage(callbacks, params, usage, parts)
+                    raise GenerationCancelled(f"Generation cancelled after {len(parts)} chunks")
+                parts.append(delta)
+                for guard in guards:
+                    error = guard.feed(delta)
+                    if error:
+                        self._count("aborted")
+                        logger.info("Stream aborted by %s after %d chunks: %s", guard.name, len(parts), error)
+                        self._log_usage(callbacks, params, usage, parts)
+                        return "".join(parts)
+        finally:
+            # Closing the generator closes the HTTP stream, the model stops generating
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+
+        self._count("completed")
+        self._log_usage(callbacks, params, usage, parts)
+        return "".join(parts)
+
+    def _log_usage(self, callbacks: Optional[List[Any]], params: Dict[str, Any], usage: Any, parts: List[str]) -> None:
+        """Reports the usage to the callbacks the way LLM.call does (e.g. the agent's TokenCalcHandler)."""
+        callbacks = [callback for callback in callbacks or [] if hasattr(callback, "log_success_event")]
+        if not callbacks:
+            return
+        if usage is None:
+            try:
+                usage = estimate_usage(params, "".join(parts))
+            except Exception as e:
+                logger.warning("Could not estimate the token usage of a streamed answer: %s", e)
+                return
+        for callback in callbacks:
+            callback.log_success_event(kwargs=params, response_obj={"usage": usage}, start_time=0, end_time=0)
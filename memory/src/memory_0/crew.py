@@ -1,8 +1,13 @@
 from crewai import Agent, Crew, Process, Task, LLM
 from crewai.project import CrewBase, agent, crew, task
 from crewai.knowledge.source.json_knowledge_source import JSONKnowledgeSource
-from memory_0.tools.json_tools import read_fruits_json, read_fruits_details_json, edit_fruits_json, edit_fruits_details_json
+from memory_0.tools.json_tools import read_fruits_json, read_fruits_details_json, query_fruits_details_json, edit_fruits_json, edit_fruits_details_json, patch_fruits_json, patch_fruits_details_json, merge_fruits_details_json
+from memory_0.tools.fruit_store import STORE_TOOLS
+from memory_0.keyed_json_knowledge_source import KeyedJSONKnowledgeSource
+from memory_0.knowledge_registry import knowledge_registry
+from memory_0.embedding_cache import EmbeddingCache, CachedEmbeddingFunction
 from dotenv import load_dotenv
+from functools import lru_cache
 import os
 from langchain_openai import ChatOpenAI
 
@@ -15,6 +20,27 @@ from langchain_openai import ChatOpenAI
 #     base_url="https://openrouter.ai/api/v1",
 #     api_key=os.getenv("OPEN_ROUTER_API_KEY"),
 # )
+
+ollama_embedder = {
+	"provider": "ollama",  # Use Ollama as the embedding provider
+	"config": {
+		"model": "nomic-embed-text",  # Example embedding model for Ollama
+		"api_key":"NA",
+	}
+}
+
+# FRUIT_STORE=sqlite gives json_manager the indexed fruit store tools instead of the JSON file tools,
+# import the JSON files first with `uv run import_fruits`. The tools write every change back to the
+# JSON files, so answering_agent's knowledge follows the store
+USE_FRUIT_STORE = os.getenv("FRUIT_STORE", "json").lower() == "sqlite"
+
+# One persistent cache under the knowledge and the short-term / entity memory embeddings,
+# so the same texts and queries are embedded only once across agents and runs. Built on
+# first use, importing the crew neither configures the embedder nor opens the cache
+@lru_cache(maxsize=None)
+def cached_embedder() -> dict:
+	return CachedEmbeddingFunction.from_config(ollama_embedder, EmbeddingCache()).as_embedder()
+
 @CrewBase
 class Memory0():
 	"""Memory0 crew"""
@@ -66,7 +92,7 @@ class Memory0():
 		)
 		return Agent(
 			config=self.agents_config['json_manager'],
-			tools=[read_fruits_json,read_fruits_details_json,edit_fruits_json, edit_fruits_details_json],
+			tools=STORE_TOOLS if USE_FRUIT_STORE else [read_fruits_json,read_fruits_details_json,query_fruits_details_json,edit_fruits_json, edit_fruits_details_json, patch_fruits_json, patch_fruits_details_json, merge_fruits_details_json],
 			verbose=True,
 			memory=True,
 			# llm=llm,
@@ -83,27 +109,22 @@ class Memory0():
 	@task
 	def json_manager_task(self) -> Task:
 		return Task(
-			config=self.tasks_config['json_manager_task'],
+			config=self.tasks_config['json_manager_store_task' if USE_FRUIT_STORE else 'json_manager_task'],
 		)
 
 	@agent
 	def answering_agent(self) -> Agent:
-		fruits_details_json = JSONKnowledgeSource(
-			file_paths=["fruits_details.json"]
-		)
+		# Chunked per fruit, edits made by json_manager's tools re-embed only the changed fruits.
+		# Shared with the crew's knowledge, the file is embedded and queried once for both
+		fruits_details_json = knowledge_registry.get(KeyedJSONKnowledgeSource, ["fruits_details.json"], embedder=cached_embedder())
 		return Agent(
 			config=self.agents_config['answering_agent'],
 			verbose=True,
 			memory=True,
 			# llm=llm,
-			knowledge_sources=[fruits_details_json],
-			 embedder={
-				"provider": "ollama",  # Use Ollama as the embedding provider
-				"config": {
-					"model": "nomic-embed-text",  # Example embedding model for Ollama
-					"api_key":"NA",
-				}
-			}
+			knowledge_sources=fruits_details_json.sources,
+			knowledge_storage=fruits_details_json.storage,
+			embedder=cached_embedder(),
 		)
 
 	@task
@@ -130,9 +151,7 @@ class Memory0():
 		#################################################
 		# Knowledgebase testing
   
-		fruits_json = JSONKnowledgeSource(
-			file_paths=["fruits_details.json"]
-		)
+		fruits_json = knowledge_registry.get(KeyedJSONKnowledgeSource, ["fruits_details.json"], embedder=cached_embedder())
   
 		#################################################
   
@@ -158,14 +177,8 @@ class Memory0():
 			#################################################
 			# Knowledgebase testing
    
-			knowledge_sources=[fruits_json],
-				embedder={
-					"provider": "ollama",  # Use Ollama as the embedding provider
-					"config": {
-					"model": "nomic-embed-text",  # Example embedding model for Ollama
-						"api_key":"NA",
-					}
-				}
+			knowledge=fruits_json.knowledge(),
+			embedder=cached_embedder(),
 
 			#################################################
    
@@ -0,0 +1,171 @@
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from chromadb import Documents, EmbeddingFunction, Embeddings
+import hashlib
+import sqlite3
+import threading
+import time
+
+
+class EmbeddingCache:
+    """Persistent embedding store keyed by (provider, model, text hash), evicting the least recently used entries.
+
+    Vectors are stored as packed float32 blobs in a single SQLite file, so the
+    same cache can be shared by the knowledge and memory storages of every crew.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = 100_000):
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def get_many(self, provider: str, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Looks up a batch of texts, returns None for every text that is not cached."""
+        hashes = [self._hash(text) for text in texts]
+        found: Dict[str, List[float]] = {}
+
+        with self._lock:
+            conn = self._connect()
+            unique = list(dict.fromkeys(hashes))
+            # Stay below SQLite's bound parameter limit
+            for start in range(0, len(unique), 500):
+                batch = unique[start : start + 500]
+                rows = conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE provider = ? AND model = ? "
+                    f"AND text_hash IN ({','.join('?' * len(batch))})",
+                    [provider, model, *batch],
+                ).fetchall()
+                for text_hash, blob in rows:
+                    found[text_hash] = array("f", blob).tolist()
+
+            if found:
+                now = time.time()
+                conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE provider = ? AND model = ? AND text_hash = ?",
+                    [(now, provider, model, text_hash) for text_hash in found],
+                )
+                conn.commit()
+
+            results = [found.get(text_hash) for text_hash in hashes]
+            hit_count = sum(result is not None for result in results)
+            self.hits += hit_count
+            self.misses += len(results) - hit_count
+
+        return results
+
+    def put_many(self, provider: str, model: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """Stores a batch of embeddings and evicts the least recently used entries above max_entries."""
+        now = time.time()
+        rows = [
+            (provider, model, self._hash(text), array("f", vector).tobytes(), now)
+            for text, vector in zip(texts, vectors)
+        ]
+
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (provider, model, text_hash, vector, last_used) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            overflow = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                conn.execute(
+                    "DELETE FROM embeddings WHERE rowid IN (SELECT rowid FROM embeddings ORDER BY last_used LIMIT ?)",
+                    (overflow,),
+                )
+            conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit and miss counters of this process, plus the number of stored entries."""
+        with self._lock:
+            entries = self._connect().execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens the database on first use, so creating a cache does no I/O."""
+        if self._conn is None:
+            if self.path is None:
+                from crewai.utilities.paths import db_storage_path
+
+                self.path = Path(db_storage_path()) / "embedding_cache.db"
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS embeddings (
+                    provider TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (provider, model, text_hash)
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        return self._conn
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class CachedEmbeddingFunction(EmbeddingFunction[Documents]):
+    """Embedding function that only sends the texts missing from the cache to the wrapped embedder.
+
+    Use it through a crewAI embedder config, e.g.
+    embedder=CachedEmbeddingFunction.from_config(OLLAMA_EMBEDDER, cache).as_embedder().
+    Any callable taking a list of texts works as the wrapped embedder, which
+    makes it easy to test with a local fake.
+    """
+
+    def __init__(self, embed: Callable[[List[str]], Any], provider: str, model: str, cache: EmbeddingCache):
+        self.embed = embed
+        self.provider = provider
+        self.model = model
+        self.cache = cache
+
+    @classmethod
+    def from_config(cls, embedder_config: Dict[str, Any], cache: EmbeddingCache) -> "CachedEmbeddingFunction":
+        """Wraps the embedder crewAI would build from a {"provider": ..., "config": {...}} dict."""
+        from crewai.utilities import EmbeddingConfigurator
+
+        embed = EmbeddingConfigurator().configure_embedder(embedder_config)
+        config = embedder_config.get("config", {})
+        return cls(embed, str(embedder_config.get("provider")), str(config.get("model")), cache)
+
+    def as_embedder(self) -> Dict[str, Any]:
+        """crewAI embedder config using this function.
+
+        crewAI 0.102+ only accepts provider names and takes embedding function
+        objects as {"provider": "custom", "config": {"embedder": ...}}. Older
+        versions have no "custom" provider and take the object as the provider.
+        """
+        from crewai.utilities import EmbeddingConfigurator
+
+        if "custom" in EmbeddingConfigurator().embedding_functions:
+            return {"provider": "custom", "config": {"embedder": self}}
+        return {"provider": self}
+
+    def __call__(self, input: Documents) -> Embeddings:
+        texts = list(input)
+        vectors = self.cache.get_many(self.provider, self.model, texts)
+
+        # Identical texts in a batch are embedded only once
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+        if missing:
+            embedded = [list(map(float, vector)) for vector in self.embed(missing)]
+            self.cache.put_many(self.provider, self.model, missing, embedded)
+            by_text = dict(zip(missing, embedded))
+            vectors = [vector if vector is not None else by_text[text] for text, vector in zip(texts, vectors)]
+
+        return vectors
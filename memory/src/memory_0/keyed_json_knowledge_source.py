@@ -0,0 +1,143 @@
+from crewai.knowledge.source.json_knowledge_source import JSONKnowledgeSource
+from crewai.utilities.paths import db_storage_path
+from memory_0.tools.json_io import add_write_hook, remove_write_hook
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from pydantic import PrivateAttr
+import hashlib
+import json
+import os
+import threading
+
+
+class KeyedJSONKnowledgeSource(JSONKnowledgeSource):
+    """JSON knowledge source that chunks per top-level key and only re-embeds the keys that changed.
+
+    A manifest per file and storage collection records the hash and the chunk
+    ids of every key. add() embeds the added and changed keys and deletes the
+    chunks of changed and removed ones. The source also registers a write hook,
+    so edits made through the JSON tools are synced right after the write
+    instead of on the next kickoff.
+    """
+
+    _sync_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _hooked: bool = PrivateAttr(default=False)
+    # (file, key) -> chunks last embedded for it, self.chunks is rebuilt from these
+    _key_chunks: Dict[Tuple[str, str], List[str]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, _):
+        """Resolves the paths only, the files are read per key when syncing."""
+        self.safe_file_paths = self._process_file_paths()
+        self.validate_content()
+
+    def add(self) -> None:
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+
+        for path in self.safe_file_paths:
+            self._sync_file(path)
+
+        if not self._hooked:
+            for path in self.safe_file_paths:
+                add_write_hook(str(path), self.refresh)
+            self._hooked = True
+
+    def close(self) -> None:
+        """Stops syncing on writes, for a source that is being replaced."""
+        if self._hooked:
+            for path in self.safe_file_paths:
+                remove_write_hook(str(path), self.refresh)
+            self._hooked = False
+
+    def refresh(self, file_path: str) -> None:
+        """Write hook, syncs the written file with the storage."""
+        try:
+            self._sync_file(Path(file_path))
+        except Exception as e:
+            # The file itself was written fine, the next add() retries the sync
+            self._logger.log("warning", f"Failed to re-index {file_path}: {str(e)}", color="yellow")
+
+    def _sync_file(self, path: Path) -> None:
+        with self._sync_lock:
+            manifest_path = self._manifest_path(path)
+            known = self._load_manifest(manifest_path)
+
+            # The storage was reset since the last sync, everything has to be embedded again
+            if known and self.storage.collection is not None and self.storage.collection.count() == 0:
+                known = {}
+
+            with open(path, "r", encoding="utf-8") as json_file:
+                data = json.load(json_file)
+
+            synced: Dict[str, Dict[str, Any]] = {}
+            new_chunks: List[str] = []
+            stale_ids: List[str] = []
+            for key, value in self._top_level_items(data):
+                key_hash = hashlib.sha256(json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+                entry = known.pop(key, None)
+                if entry and entry["hash"] == key_hash:
+                    synced[key] = entry
+                    continue
+
+                chunks = self._chunk_text(self._json_to_text({key: value}))
+                chunk_ids = [hashlib.sha256(chunk.encode("utf-8")).hexdigest() for chunk in chunks]
+                new_chunks.extend(chunks)
+                self._key_chunks[(str(path), key)] = chunks
+                if entry:
+                    stale_ids.extend(entry["chunk_ids"])
+                synced[key] = {"hash": key_hash, "chunk_ids": chunk_ids}
+
+            # Keys left in the manifest were removed from the file
+            for key, entry in known.items():
+                stale_ids.extend(entry["chunk_ids"])
+                self._key_chunks.pop((str(path), key), None)
+
+            self.chunks = [chunk for chunks in self._key_chunks.values() for chunk in chunks]
+            if new_chunks:
+                self.storage.save(new_chunks)
+
+            live_ids = {chunk_id for entry in synced.values() for chunk_id in entry["chunk_ids"]}
+            stale_ids = [chunk_id for chunk_id in dict.fromkeys(stale_ids) if chunk_id not in live_ids]
+            if stale_ids and hasattr(self.storage, "delete"):
+                # Lets storages that memoize searches drop them
+                self.storage.delete(stale_ids)
+            elif stale_ids and self.storage.collection is not None:
+                self.storage.collection.delete(ids=stale_ids)
+
+            if new_chunks or stale_ids:
+                self._logger.log(
+                    "info",
+                    f"Re-indexed {path.name}: {len(new_chunks)} chunks embedded, {len(stale_ids)} removed",
+                    color="green",
+                )
+            self._save_manifest(manifest_path, synced)
+
+    @staticmethod
+    def _top_level_items(data: Any) -> List[Tuple[str, Any]]:
+        if isinstance(data, dict):
+            return [(str(key), value) for key, value in data.items()]
+        if isinstance(data, list):
+            return [(str(index), value) for index, value in enumerate(data)]
+        return [("", data)]
+
+    def _manifest_path(self, path: Path) -> Path:
+        """Manifest file of this JSON file and storage collection."""
+        collection_name = self.storage.collection_name or "knowledge"
+        key = hashlib.sha256(f"{Path(path).resolve()}|{collection_name}".encode("utf-8")).hexdigest()
+        return Path(db_storage_path()) / "knowledge" / "json_key_manifests" / f"{key}.json"
+
+    @staticmethod
+    def _load_manifest(manifest_path: Path) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def _save_manifest(manifest_path: Path, manifest: Dict[str, Any]) -> None:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(manifest, file)
+        os.replace(tmp_path, manifest_path)
@@ -0,0 +1,197 @@
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+import hashlib
+import json
+import threading
+
+
+class SharedKnowledgeStorage(KnowledgeStorage):
+    """Knowledge storage shared by every agent and crew holding the same registered source.
+
+    The collection is opened once, each source is added once no matter how many
+    Knowledge objects wrap the storage, and identical searches (an agent's and
+    its crew's knowledge query for the same task prompt) hit the collection once.
+    """
+
+    def __init__(self, embedder: Optional[Dict[str, Any]] = None, collection_name: Optional[str] = None, max_cached_searches: int = 256):
+        super().__init__(embedder=embedder, collection_name=collection_name)
+        self.max_cached_searches = max_cached_searches
+        self.search_hits = 0
+        self.search_misses = 0
+        self._lock = threading.RLock()
+        self._initialized = False
+        self._added: set = set()
+        self._searches: "OrderedDict[Tuple, List[Dict[str, Any]]]" = OrderedDict()
+
+    def initialize_knowledge_storage(self):
+        with self._lock:
+            if not self._initialized:
+                super().initialize_knowledge_storage()
+                self._initialized = True
+
+    def add_once(self, source: BaseKnowledgeSource) -> None:
+        """Adds a source unless it was already added to this storage."""
+        with self._lock:
+            if id(source) in self._added:
+                return
+            source.storage = self
+            source.add()
+            self._added.add(id(source))
+
+    def search(self, query: List[str], limit: int = 3, filter: Optional[dict] = None, score_threshold: float = 0.35) -> List[Dict[str, Any]]:
+        key = (tuple(query), limit, json.dumps(filter, sort_keys=True, default=str), score_threshold)
+        with self._lock:
+            if key in self._searches:
+                self._searches.move_to_end(key)
+                self.search_hits += 1
+                return list(self._searches[key])
+            self.search_misses += 1
+            results = super().search(query, limit, filter, score_threshold)
+            self._searches[key] = results
+            if len(self._searches) > self.max_cached_searches:
+                self._searches.popitem(last=False)
+            return list(results)
+
+    def save(self, documents: List[str], metadata: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None):
+        with self._lock:
+            self._searches.clear()
+            return super().save(documents, metadata)
+
+    def delete(self, ids: List[str]) -> None:
+        """Removes chunks by id and drops the memoized searches."""
+        with self._lock:
+            self._searches.clear()
+            if self.collection:
+                self.collection.delete(ids=ids)
+
+    def reset(self):
+        with self._lock:
+            self._searches.clear()
+            self._added.clear()
+            self._initialized = False
+            super().reset()
+
+
+class SharedKnowledgeSource(BaseKnowledgeSource):
+    """Handle to a registered source, adding it to a SharedKnowledgeStorage is a no-op after the first time."""
+
+    source: BaseKnowledgeSource
+
+    def validate_content(self):
+        """The wrapped source validated its content when it was built."""
+
+    def add(self) -> None:
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+
+        if isinstance(self.storage, SharedKnowledgeStorage):
+            self.storage.add_once(self.source)
+        else:
+            self.source.storage = self.storage
+            self.source.add()
+
+
+class SharedKnowledge:
+    """One loaded and embedded knowledge source, with what agents and crews need to use it.
+
+    Agent(knowledge_sources=shared.sources, knowledge_storage=shared.storage, ...)
+    Crew(knowledge=shared.knowledge(), ...)
+    """
+
+    def __init__(self, key: str, source: BaseKnowledgeSource, storage: SharedKnowledgeStorage, embedder: Optional[Dict[str, Any]], content_hash: str = ""):
+        self.key = key
+        self.source = source
+        self.storage = storage
+        self.embedder = embedder
+        self.content_hash = content_hash
+        self.sources: List[BaseKnowledgeSource] = [SharedKnowledgeSource(source=source)]
+        self._knowledge: Optional[Knowledge] = None
+        self._lock = threading.Lock()
+
+    def knowledge(self) -> Knowledge:
+        """The Knowledge object for a crew, built once."""
+        with self._lock:
+            if self._knowledge is None:
+                self._knowledge = Knowledge(
+                    collection_name=self.storage.collection_name,
+                    sources=self.sources,
+                    embedder=self.embedder,
+                    storage=self.storage,
+                )
+            return self._knowledge
+
+
+class KnowledgeRegistry:
+    """Process-wide registry handing out one SharedKnowledge per (source type, resolved paths, embedder config, options).
+
+    When the files changed since the entry was built, get() replaces its source
+    with a new one on the same storage, which syncs the change into the same
+    collection. The old source is closed (a KeyedJSONKnowledgeSource drops its
+    write hooks) and its entry forgotten.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, SharedKnowledge] = {}
+
+    def get(self, source_class: Type[BaseKnowledgeSource], file_paths: List[Union[str, Path]], embedder: Optional[Dict[str, Any]] = None, **options) -> SharedKnowledge:
+        """Returns the shared instance for these files, building and registering the source on the first call."""
+        paths = [self._resolve(path) for path in file_paths]
+        source_type = f"{source_class.__module__}.{source_class.__qualname__}"
+        config = json.dumps([embedder, options], sort_keys=True, default=self._describe)
+        content_hash = self._hash_files(paths)
+        key = hashlib.sha256(f"{source_type}|{[str(path) for path in paths]}|{config}".encode("utf-8")).hexdigest()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.content_hash == content_hash:
+                return entry
+
+            if entry is not None:
+                # Changed since the entry was built: a new source syncs the files into the same storage
+                self._close(entry)
+                storage = entry.storage
+            else:
+                storage = SharedKnowledgeStorage(embedder=embedder, collection_name=f"shared_{key[:16]}")
+            source = source_class(file_paths=paths, **options)
+            self._entries[key] = SharedKnowledge(key, source, storage, embedder, content_hash)
+            return self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry in self._entries.values():
+                self._close(entry)
+            self._entries.clear()
+
+    @staticmethod
+    def _close(entry: SharedKnowledge) -> None:
+        close = getattr(entry.source, "close", None)
+        if close:
+            close()
+
+    @staticmethod
+    def _resolve(path: Union[str, Path]) -> Path:
+        # Same rule as the file knowledge sources: strings are relative to the knowledge directory
+        return (Path(KNOWLEDGE_DIRECTORY) / path if isinstance(path, str) else Path(path)).resolve()
+
+    @staticmethod
+    def _hash_files(paths: List[Path]) -> str:
+        digest = hashlib.sha256()
+        for path in paths:
+            with open(path, "rb") as file:
+                for block in iter(lambda: file.read(1024 * 1024), b""):
+                    digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _describe(value: Any) -> str:
+        """Embedder configs may hold embedding function objects, these compare by identity."""
+        return f"{type(value).__module__}.{type(value).__qualname__}@{id(value):x}"
+
+
+knowledge_registry = KnowledgeRegistry()
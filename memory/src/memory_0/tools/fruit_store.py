@@ -0,0 +1,234 @@
+import json
+import os
+import sqlite3
+import sys
+import threading
+from typing import Any, Dict, List, Optional
+
+from crewai.tools import tool
+
+from memory_0.tools.json_io import locked, read_json_fresh, update_json, write_json_atomic
+from memory_0.tools.json_tools import DATA_FRUIT, DATA_FRUIT_DETAILS
+
+DATA_FRUIT_STORE = os.getenv("FRUIT_STORE_PATH", "knowledge/fruits.sqlite3")
+
+
+class FruitStore:
+    """Indexed key-value store for the fruit list and the fruit details, an alternative to the two JSON files.
+
+    Runs SQLite in WAL mode, so crews in other processes can read while one
+    writes, and every put or delete touches a single row instead of rewriting a file.
+    The store tools mirror each changed fruit into the JSON files, which stay
+    the source of the agents' knowledge.
+    """
+
+    def __init__(self, path: str = DATA_FRUIT_STORE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS fruits (name TEXT PRIMARY KEY, position INTEGER NOT NULL)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS fruit_details (name TEXT PRIMARY KEY, details TEXT NOT NULL)")
+            self._conn.commit()
+        return self._conn
+
+    def list_fruits(self) -> List[str]:
+        with self._lock:
+            return [name for (name,) in self._connect().execute("SELECT name FROM fruits ORDER BY position")]
+
+    def put_fruit(self, name: str) -> bool:
+        """Adds a fruit to the end of the list, returns False if it was already there."""
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO fruits (name, position) SELECT ?, COALESCE(MAX(position) + 1, 0) FROM fruits",
+                (name,),
+            )
+            return cursor.rowcount > 0
+
+    def delete_fruit(self, name: str) -> bool:
+        with self._lock, self._connect() as conn:
+            return conn.execute("DELETE FROM fruits WHERE name = ?", (name,)).rowcount > 0
+
+    def get_details(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connect().execute("SELECT details FROM fruit_details WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_details(self, name: str, details: Dict[str, Any]) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO fruit_details (name, details) VALUES (?, ?)",
+                (name, json.dumps(details, ensure_ascii=False)),
+            )
+
+    def delete_details(self, name: str) -> bool:
+        with self._lock, self._connect() as conn:
+            return conn.execute("DELETE FROM fruit_details WHERE name = ?", (name,)).rowcount > 0
+
+    def list_missing_details(self) -> List[str]:
+        """Fruits of the list without details, one indexed anti-join."""
+        with self._lock:
+            return [
+                name
+                for (name,) in self._connect().execute(
+                    "SELECT fruits.name FROM fruits LEFT JOIN fruit_details ON fruit_details.name = fruits.name "
+                    "WHERE fruit_details.name IS NULL ORDER BY fruits.position"
+                )
+            ]
+
+    def import_json(self, fruits_path: str, details_path: str) -> Dict[str, int]:
+        """Replaces the store's content with fruits.json and fruits_details.json."""
+        fruits = read_json_fresh(fruits_path).get("fruits", [])
+        details = read_json_fresh(details_path)
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM fruits")
+            conn.execute("DELETE FROM fruit_details")
+            conn.executemany(
+                "INSERT OR IGNORE INTO fruits (name, position) VALUES (?, ?)",
+                [(name, position) for position, name in enumerate(fruits)],
+            )
+            conn.executemany(
+                "INSERT INTO fruit_details (name, details) VALUES (?, ?)",
+                [(name, json.dumps(value, ensure_ascii=False)) for name, value in details.items()],
+            )
+        return {"fruits": len(fruits), "details": len(details)}
+
+    def export_json(self, fruits_path: str, details_path: str) -> Dict[str, int]:
+        """Writes the store back out in the format of fruits.json and fruits_details.json."""
+        return {"fruits": self.export_fruits(fruits_path), "details": self.export_details(details_path)}
+
+    def export_fruits(self, fruits_path: str) -> int:
+        # The tables are read under the file lock, so a slower writer cannot put an older snapshot last
+        with locked(fruits_path):
+            fruits = self.list_fruits()
+            write_json_atomic(fruits_path, {"fruits": fruits})
+        return len(fruits)
+
+    def export_details(self, details_path: str) -> int:
+        with locked(details_path):
+            with self._lock:
+                details = {
+                    name: json.loads(value)
+                    for name, value in self._connect().execute("SELECT name, details FROM fruit_details ORDER BY rowid")
+                }
+            write_json_atomic(details_path, details)
+        return len(details)
+
+    def mirror_fruits(self, fruits_path: str) -> None:
+        """Copies the fruit list into fruits_path, keeping the file's other keys."""
+        update_json(fruits_path, lambda content: {**content, "fruits": self.list_fruits()})
+
+    def mirror_details(self, name: str, details_path: str) -> None:
+        """Copies one fruit's details into details_path, or removes them there if the store has none.
+
+        The row is read under the file lock, so whichever process writes the
+        file last mirrors the newest row. Only that fruit's key changes, keyed
+        knowledge sources of the file re-embed just that fruit.
+        """
+
+        def change(content: Dict[str, Any]) -> Dict[str, Any]:
+            details = self.get_details(name)
+            if details is None:
+                content.pop(name, None)
+            else:
+                content[name] = details
+            return content
+
+        update_json(details_path, change)
+
+
+fruit_store = FruitStore()
+
+
+def _mirror_json(fruits: bool = False, details: Optional[str] = None) -> None:
+    """Copies a change into the JSON files the agents' knowledge is built from, details is the changed fruit."""
+    if fruits:
+        fruit_store.mirror_fruits(DATA_FRUIT)
+    if details:
+        fruit_store.mirror_details(details, DATA_FRUIT_DETAILS)
+
+
+@tool
+def list_fruits() -> List[str]:
+    """
+    Returns the names of all fruits in the fruit store, in list order.
+    """
+    return fruit_store.list_fruits()
+
+@tool
+def list_fruits_missing_details() -> List[str]:
+    """
+    Returns the fruits that are in the fruit list but have no details yet.
+    An empty list means every fruit has details.
+    """
+    return fruit_store.list_missing_details()
+
+@tool
+def get_fruit_details(name: str) -> Dict[str, Any]:
+    """
+    Returns the details of one fruit, like {"name": "Apple", "description": "..."}.
+    An empty dictionary is returned if the fruit has no details.
+    """
+    return fruit_store.get_details(name) or {}
+
+@tool
+def put_fruit(name: str) -> str:
+    """
+    Adds a new fruit to the end of the fruit list.
+    """
+    if fruit_store.put_fruit(name):
+        _mirror_json(fruits=True)
+        return f"Successfully added {name} to the fruit list."
+    return f"{name} is already in the fruit list."
+
+@tool
+def put_fruit_details(name: str, description: str) -> str:
+    """
+    Adds or replaces the details of one fruit with its name and description.
+    """
+    fruit_store.put_details(name, {"name": name, "description": description})
+    _mirror_json(details=name)
+    return f"Successfully saved the details of {name}."
+
+@tool
+def delete_fruit(name: str) -> str:
+    """
+    Removes a fruit from the fruit list and deletes its details.
+    """
+    removed_fruit = fruit_store.delete_fruit(name)
+    removed_details = fruit_store.delete_details(name)
+    _mirror_json(fruits=removed_fruit, details=name if removed_details else None)
+    if removed_fruit or removed_details:
+        return f"Successfully deleted {name}."
+    return f"{name} is not in the fruit store."
+
+
+STORE_TOOLS = [list_fruits, list_fruits_missing_details, get_fruit_details, put_fruit, put_fruit_details, delete_fruit]
+
+
+def _json_paths() -> List[str]:
+    return sys.argv[1:3] if len(sys.argv) >= 3 else [DATA_FRUIT, DATA_FRUIT_DETAILS]
+
+
+def import_json():
+    """
+    Import knowledge/fruits.json and knowledge/fruits_details.json into the fruit store.
+    Optional arguments: fruits path, details path.
+    """
+    counts = fruit_store.import_json(*_json_paths())
+    print(f"Imported {counts['fruits']} fruits and {counts['details']} fruit details into {fruit_store.path}")
+
+
+def export_json():
+    """
+    Export the fruit store to knowledge/fruits.json and knowledge/fruits_details.json.
+    Optional arguments: fruits path, details path.
+    """
+    counts = fruit_store.export_json(*_json_paths())
+    print(f"Exported {counts['fruits']} fruits and {counts['details']} fruit details from {fruit_store.path}")
@@ -0,0 +1,110 @@
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+class FrozenDict(dict):
+    """Read-only dict handed out by the cache, so one tool call cannot change what the next one reads."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Cached JSON data is read-only, edit the file through the edit tools instead.")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = __ior__ = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class FrozenList(list):
+    """Read-only list counterpart of FrozenDict, still printed and serialized as a JSON array."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Cached JSON data is read-only, edit the file through the edit tools instead.")
+
+    __setitem__ = __delitem__ = append = extend = insert = pop = remove = clear = sort = reverse = __iadd__ = __imul__ = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def freeze(value: Any) -> Any:
+    """Converts parsed JSON into FrozenDict / FrozenList views."""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+class JSONReadCache:
+    """Process-wide cache of parsed JSON files keyed by (path, mtime_ns, size).
+
+    A read costs one os.stat while the file is unchanged. Writers should call
+    invalidate() after writing, which also covers edits that keep the size and
+    land within the filesystem's mtime resolution.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+    def read(self, file_path: str, default: Optional[Any] = None) -> Any:
+        """Returns the frozen content of a JSON file, or default if it is missing or invalid."""
+        default = FrozenDict() if default is None else default
+        path = os.path.abspath(file_path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            with self._lock:
+                self._entries.pop(path, None)
+                self.misses += 1
+            return default
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and entry[0] == key:
+                self.hits += 1
+                return default if entry[1] is None else entry[1]
+            self.misses += 1
+
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = freeze(json.load(file))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            # Invalid files are cached too, until they change
+            data = None
+
+        with self._lock:
+            self._entries[path] = (key, data)
+        return default if data is None else data
+
+    def invalidate(self, file_path: str) -> None:
+        with self._lock:
+            self._entries.pop(os.path.abspath(file_path), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+            }
+
+
+json_cache = JSONReadCache()
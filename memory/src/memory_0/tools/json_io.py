@@ -0,0 +1,151 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List
+
+from memory_0.tools.json_cache import json_cache
+
+logger = logging.getLogger(__name__)
+
+if os.name == "nt":
+    import msvcrt
+
+    def _lock(file) -> None:
+        file.seek(0)
+        # LK_LOCK retries for ~10 seconds, keep trying after that
+        while True:
+            try:
+                msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def _unlock(file) -> None:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock(file) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+    def _unlock(file) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+_write_hooks: Dict[str, List[Callable[[], Any]]] = {}  # Weak references to the hooks
+_hooks_lock = threading.Lock()
+_held = threading.local()  # Per thread: files locked by locked() -> whether they were written
+
+
+def add_write_hook(file_path: str, hook: Callable[[str], None]) -> None:
+    """Calls hook(file_path) after every write of the file through write_json_atomic.
+
+    Writes made under locked(file_path) call the hook once the lock is released,
+    so a slow hook (e.g. re-embedding) does not hold up other writers.
+    Bound methods are held weakly, so a knowledge source that is garbage collected
+    stops receiving calls without having to unregister.
+    """
+    ref = weakref.WeakMethod(hook) if hasattr(hook, "__self__") else (lambda: hook)
+    with _hooks_lock:
+        _write_hooks.setdefault(os.path.abspath(file_path), []).append(ref)
+
+
+def remove_write_hook(file_path: str, hook: Callable[[str], None]) -> None:
+    with _hooks_lock:
+        hooks = _write_hooks.get(os.path.abspath(file_path), [])
+        hooks[:] = [ref for ref in hooks if ref() not in (None, hook)]
+
+
+def _held_files() -> Dict[str, bool]:
+    held = getattr(_held, "files", None)
+    if held is None:
+        held = _held.files = {}
+    return held
+
+
+def _run_write_hooks(file_path: str) -> None:
+    with _hooks_lock:
+        hooks = _write_hooks.get(os.path.abspath(file_path), [])
+        hooks[:] = [ref for ref in hooks if ref() is not None]
+        callbacks = [ref() for ref in hooks]
+    for callback in callbacks:
+        if callback is None:
+            continue
+        # The write already went through, a failing hook must not look like a failed write
+        try:
+            callback(file_path)
+        except Exception:
+            logger.exception("Write hook %r failed for %s", callback, file_path)
+
+
+@contextmanager
+def locked(file_path: str) -> Iterator[None]:
+    """Holds an exclusive advisory lock on <file_path>.lock, shared by every process and crew writing the file."""
+    key = os.path.abspath(file_path)
+    lock_path = key + ".lock"
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    held = _held_files()
+    try:
+        with open(lock_path, "a+b") as lock_file:
+            _lock(lock_file)
+            held[key] = False
+            try:
+                yield
+            finally:
+                _unlock(lock_file)
+    finally:
+        # Write hooks of the writes made under the lock run once it is released
+        if held.pop(key, False):
+            _run_write_hooks(file_path)
+
+
+def write_json_atomic(file_path: str, content: Any) -> None:
+    """Writes JSON to a temp file in the same directory and swaps it in with os.replace.
+
+    Readers see either the old or the new file, never a half-written one.
+    Call it while holding locked(file_path). Registered write hooks run after the
+    swap, once locked(file_path) is released.
+    """
+    text = json.dumps(content, ensure_ascii=False, indent=4)
+    directory = os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    json_cache.invalidate(file_path)
+    held = _held_files()
+    key = os.path.abspath(file_path)
+    if key in held:
+        held[key] = True
+    else:
+        _run_write_hooks(file_path)
+
+
+def read_json_fresh(file_path: str) -> Any:
+    """Reads a mutable copy from disk, {} if the file does not exist."""
+    try:
+        with open(file_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def update_json(file_path: str, change: Callable[[Any], Any]) -> Any:
+    """Read-modify-write under the file lock, returns the new content."""
+    with locked(file_path):
+        content = change(read_json_fresh(file_path))
+        write_json_atomic(file_path, content)
+    return content
@@ -0,0 +1,131 @@
+import copy
+from typing import Any, Dict, List
+
+
+class JSONPatchError(ValueError):
+    """Raised when a patch operation cannot be applied to the document."""
+
+
+def _parse_pointer(pointer: str) -> List[str]:
+    """Splits an RFC 6901 JSON pointer into unescaped reference tokens."""
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JSONPatchError(f"Invalid JSON pointer {pointer!r}, it must start with '/'.")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _index(container: list, token: str, allow_end: bool = False) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    if not token.isdigit() or (token.startswith("0") and token != "0"):
+        raise JSONPatchError(f"Invalid array index {token!r}.")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise JSONPatchError(f"Array index {index} is out of range.")
+    return index
+
+
+def _resolve(document: Any, tokens: List[str]) -> Any:
+    for token in tokens:
+        if isinstance(document, dict):
+            if token not in document:
+                raise JSONPatchError(f"Key {token!r} does not exist.")
+            document = document[token]
+        elif isinstance(document, list):
+            document = document[_index(document, token)]
+        else:
+            raise JSONPatchError(f"Cannot descend into {type(document).__name__} with {token!r}.")
+    return document
+
+
+def _add(document: Any, tokens: List[str], value: Any) -> Any:
+    if not tokens:
+        return value
+    parent = _resolve(document, tokens[:-1])
+    if isinstance(parent, dict):
+        parent[tokens[-1]] = value
+    elif isinstance(parent, list):
+        parent.insert(_index(parent, tokens[-1], allow_end=True), value)
+    else:
+        raise JSONPatchError(f"Cannot add to {type(parent).__name__}.")
+    return document
+
+
+def _remove(document: Any, tokens: List[str]) -> Any:
+    if not tokens:
+        raise JSONPatchError("Cannot remove the whole document.")
+    parent = _resolve(document, tokens[:-1])
+    if isinstance(parent, dict):
+        if tokens[-1] not in parent:
+            raise JSONPatchError(f"Key {tokens[-1]!r} does not exist.")
+        return parent.pop(tokens[-1])
+    if isinstance(parent, list):
+        return parent.pop(_index(parent, tokens[-1]))
+    raise JSONPatchError(f"Cannot remove from {type(parent).__name__}.")
+
+
+def _equal(left: Any, right: Any) -> bool:
+    """JSON equality for the test operation: true and 1, or false and 0, are different values."""
+    if isinstance(left, bool) or isinstance(right, bool):
+        return isinstance(left, bool) and isinstance(right, bool) and left == right
+    if isinstance(left, dict) and isinstance(right, dict):
+        return left.keys() == right.keys() and all(_equal(left[key], right[key]) for key in left)
+    if isinstance(left, list) and isinstance(right, list):
+        return len(left) == len(right) and all(_equal(a, b) for a, b in zip(left, right))
+    if isinstance(left, (dict, list)) or isinstance(right, (dict, list)):
+        return False
+    return left == right
+
+
+def apply_json_patch(document: Any, operations: List[Dict[str, Any]]) -> Any:
+    """Applies an RFC 6902 JSON Patch and returns the patched document.
+
+    The input is not modified, and if any operation fails none of them are applied.
+    """
+    document = copy.deepcopy(document)
+    for number, operation in enumerate(operations):
+        if not isinstance(operation, dict):
+            raise JSONPatchError(f"Operation {number} must be an object, got {type(operation).__name__}.")
+        try:
+            op = operation["op"]
+            tokens = _parse_pointer(operation["path"])
+            if op == "add":
+                document = _add(document, tokens, copy.deepcopy(operation["value"]))
+            elif op == "remove":
+                _remove(document, tokens)
+            elif op == "replace":
+                _resolve(document, tokens)
+                if tokens:
+                    _remove(document, tokens)
+                document = _add(document, tokens, copy.deepcopy(operation["value"]))
+            elif op in ("move", "copy"):
+                source = _parse_pointer(operation["from"])
+                if op == "move" and tokens[: len(source)] == source and tokens != source:
+                    raise JSONPatchError("Cannot move a value into one of its own children.")
+                value = _remove(document, source) if op == "move" else copy.deepcopy(_resolve(document, source))
+                document = _add(document, tokens, value)
+            elif op == "test":
+                if not _equal(_resolve(document, tokens), operation["value"]):
+                    raise JSONPatchError(f"Test failed at {operation['path']!r}.")
+            else:
+                raise JSONPatchError(f"Unknown operation {op!r}.")
+        except KeyError as e:
+            raise JSONPatchError(f"Operation {number} is missing the {e.args[0]!r} member.")
+        except JSONPatchError as e:
+            raise JSONPatchError(f"Operation {number} ({operation.get('op')} {operation.get('path')}): {e}")
+    return document
+
+
+def apply_merge_patch(target: Any, patch: Any) -> Any:
+    """Applies an RFC 7396 JSON Merge Patch: objects merge recursively, null deletes a key, anything else replaces."""
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+
+    result = copy.deepcopy(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_merge_patch(result.get(key), value)
+    return result
@@ -0,0 +1,254 @@
+import base64
+import json
+import os
+import re
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Union
+
+_STRING_SPECIAL = re.compile(r'["\\]')
+_STRUCTURE = re.compile(r'["{}\[\]]')
+_SCALAR_END = re.compile(r'[\s,\]}]')
+_SELECTOR_TOKEN = re.compile(r"""\.([^.\[\]]+)|\[(\d+)\]|\[(?:'([^']*)'|"([^"]*)")\]""")
+
+
+class JSONQueryError(ValueError):
+    """Raised for malformed selectors, cursors or JSON, and for selectors that match nothing."""
+
+
+def parse_selector(selector: str) -> List[Union[str, int]]:
+    """Turns "Apple.description", "$.fruits[0]" or "$['key.with.dots']" into a list of keys and indexes."""
+    selector = selector.strip()
+    if selector in ("", "$"):
+        return []
+    if selector.startswith("$"):
+        selector = selector[1:]
+    elif not selector.startswith((".", "[")):
+        selector = "." + selector
+
+    tokens: List[Union[str, int]] = []
+    position = 0
+    while position < len(selector):
+        match = _SELECTOR_TOKEN.match(selector, position)
+        if not match:
+            raise JSONQueryError(f"Invalid selector near {selector[position:]!r}.")
+        key, index, single, double = match.groups()
+        if index is not None:
+            tokens.append(int(index))
+        else:
+            tokens.append(next(part for part in (key, single, double) if part is not None))
+        position = match.end()
+    return tokens
+
+
+class _Scanner:
+    """Reads JSON from a file in chunks and walks it one token at a time.
+
+    Values that are skipped are scanned but never built, only the values that
+    are returned are decoded, so memory follows the size of the result.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int = 65536):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self._capture: Optional[List[str]] = None
+        self._capture_start = 0
+
+    def _fill(self) -> bool:
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            return False
+        if self._capture is not None:
+            self._capture.append(self.buf[self._capture_start : self.pos])
+            self._capture_start = 0
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it, "" at the end of the file."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def next(self) -> str:
+        char = self.peek()
+        if not char:
+            raise JSONQueryError("Unexpected end of JSON.")
+        self.pos += 1
+        return char
+
+    def expect(self, char: str) -> None:
+        found = self.next()
+        if found != char:
+            raise JSONQueryError(f"Expected {char!r} but found {found!r}.")
+
+    def skip_string(self) -> None:
+        self.expect('"')
+        while True:
+            match = _STRING_SPECIAL.search(self.buf, self.pos)
+            if not match:
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise JSONQueryError("Unterminated string.")
+                continue
+            if match.group() == '"':
+                self.pos = match.end()
+                return
+            # Backslash, the escaped character may be in the next chunk
+            self.pos = match.end()
+            if self.pos >= len(self.buf) and not self._fill():
+                raise JSONQueryError("Unterminated string.")
+            self.pos += 1
+
+    def skip_value(self) -> None:
+        char = self.peek()
+        if char == '"':
+            self.skip_string()
+        elif char in ("{", "["):
+            self.pos += 1
+            depth = 1
+            while depth:
+                match = _STRUCTURE.search(self.buf, self.pos)
+                if not match:
+                    self.pos = len(self.buf)
+                    if not self._fill():
+                        raise JSONQueryError("Unexpected end of JSON.")
+                    continue
+                if match.group() == '"':
+                    self.pos = match.start()
+                    self.skip_string()
+                    continue
+                depth += 1 if match.group() in "{[" else -1
+                self.pos = match.end()
+        elif char:
+            while True:
+                match = _SCALAR_END.search(self.buf, self.pos)
+                if match:
+                    self.pos = match.start()
+                    return
+                self.pos = len(self.buf)
+                if not self._fill():
+                    return
+        else:
+            raise JSONQueryError("Unexpected end of JSON.")
+
+    def read_value(self) -> Any:
+        """Decodes the next value, and only that value."""
+        self.peek()
+        self._capture, self._capture_start = [], self.pos
+        try:
+            self.skip_value()
+            self._capture.append(self.buf[self._capture_start : self.pos])
+            text = "".join(self._capture)
+        finally:
+            self._capture = None
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as e:
+            raise JSONQueryError(f"Invalid JSON value: {e}")
+
+    def children(self) -> Iterator[Union[str, int]]:
+        """Yields the keys of the object or indexes of the array at the cursor.
+
+        The caller consumes each child's value before asking for the next one.
+        """
+        opening = self.next()
+        if opening not in ("{", "["):
+            raise JSONQueryError(f"Expected an object or array but found {opening!r}.")
+        closing = "}" if opening == "{" else "]"
+        if self.peek() == closing:
+            self.pos += 1
+            return
+
+        index = 0
+        while True:
+            if opening == "{":
+                key = self.read_value()
+                self.expect(":")
+                yield key
+            else:
+                yield index
+            index += 1
+            separator = self.next()
+            if separator == closing:
+                return
+            if separator != ",":
+                raise JSONQueryError(f"Expected ',' or {closing!r} but found {separator!r}.")
+
+
+def _encode_cursor(selector: str, offset: int, stat: os.stat_result) -> str:
+    state = {"selector": selector, "offset": offset, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    return base64.urlsafe_b64encode(json.dumps(state).encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Dict[str, Any]:
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except ValueError:
+        raise JSONQueryError("Invalid cursor.")
+
+
+def query_json_file(file_path: str, selector: str = "$", limit: int = 20, offset: int = 0, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """Returns the value at selector, paging through its children if it is an object or array.
+
+    The file is stream-parsed: everything before the match is skipped without
+    being decoded and reading stops as soon as the requested page is complete.
+    The result holds "value" for scalars, or "items" plus "next_cursor" (None on
+    the last page) for objects and arrays.
+    """
+    # A page of nothing would hand back the same cursor forever
+    if limit < 1:
+        raise JSONQueryError(f"limit must be at least 1, got {limit}.")
+    stat = os.stat(file_path)
+    if cursor:
+        state = _decode_cursor(cursor)
+        if (state.get("mtime_ns"), state.get("size")) != (stat.st_mtime_ns, stat.st_size):
+            raise JSONQueryError("The file changed since the cursor was created, start the query again.")
+        selector, offset = state["selector"], state["offset"]
+    if not isinstance(offset, int) or offset < 0:
+        raise JSONQueryError(f"offset must be a non-negative integer, got {offset!r}.")
+    tokens = parse_selector(selector)
+
+    with open(file_path, "r", encoding="utf-8") as file:
+        scanner = _Scanner(file)
+        for depth, token in enumerate(tokens):
+            expected = "{" if isinstance(token, str) else "["
+            if scanner.peek() != expected:
+                raise JSONQueryError(f"Nothing matches {selector!r}: {_path(tokens[:depth])} is not an {'object' if expected == '{' else 'array'}.")
+            for child in scanner.children():
+                if child == token:
+                    break
+                scanner.skip_value()
+            else:
+                raise JSONQueryError(f"Nothing matches {selector!r}: {_path(tokens[: depth + 1])} does not exist.")
+
+        if scanner.peek() not in ("{", "["):
+            return {"selector": selector, "value": scanner.read_value()}
+
+        is_object = scanner.peek() == "{"
+        items: Union[Dict[str, Any], List[Any]] = {} if is_object else []
+        next_cursor = None
+        for position, child in enumerate(scanner.children()):
+            if position < offset:
+                scanner.skip_value()
+            elif position < offset + limit:
+                value = scanner.read_value()
+                if is_object:
+                    items[child] = value
+                else:
+                    items.append(value)
+            else:
+                # One more child exists, no need to read further
+                next_cursor = _encode_cursor(selector, offset + limit, stat)
+                break
+
+    return {"selector": selector, "offset": offset, "items": items, "next_cursor": next_cursor}
+
+
+def _path(tokens: List[Union[str, int]]) -> str:
+    return "$" + "".join(f"[{token}]" if isinstance(token, int) else f".{token}" for token in tokens)
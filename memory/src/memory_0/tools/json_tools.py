@@ -1,8 +1,10 @@
-import json
-import os
 from pydantic import BaseModel
 from crewai.tools import tool
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from memory_0.tools.json_cache import json_cache
+from memory_0.tools.json_io import locked, update_json, write_json_atomic
+from memory_0.tools.json_patch import JSONPatchError, apply_json_patch, apply_merge_patch
+from memory_0.tools.json_stream import JSONQueryError, query_json_file
 
 DATA_FRUIT = "knowledge/fruits.json"
 DATA_FRUIT_DETAILS = "knowledge/fruits_details.json"
@@ -16,17 +18,10 @@ def read_fruits_json() -> Dict[str, Any]:
     """
     Reads and returns the raw JSON content from fruits.json.
     This file contains the different types of fruits.
+    Repeated reads of an unchanged file are served from a shared cache.
     If the file does not exist or is invalid, an empty dictionary is returned.
     """
-    if not os.path.exists(DATA_FRUIT):
-        return {}  # Return empty dictionary if file doesn't exist
-    
-    try:
-        with open(DATA_FRUIT, "r", encoding="utf-8") as file:
-            data = json.load(file)
-            return data  # Return as a raw JSON dictionary
-    except json.JSONDecodeError:
-        return {}  # Return empty dictionary if JSON is invalid
+    return json_cache.read(DATA_FRUIT)
 
 @tool
 def read_fruits_details_json() -> Dict[str, Any]:
@@ -35,30 +30,26 @@ def read_fruits_details_json() -> Dict[str, Any]:
     This file contains fruit names and their description.
     If the file does not exist or is invalid, an empty dictionary is returned.
     """
-    if not os.path.exists(DATA_FRUIT_DETAILS):
-        return {}  # Return empty dictionary if file doesn't exist
-    
-    try:
-        with open(DATA_FRUIT_DETAILS, "r", encoding="utf-8") as file:
-            data = json.load(file)
-            return data  # Return as a raw JSON dictionary
-    except json.JSONDecodeError:
-        return {}  # Return empty dictionary if JSON is invalid
+    return json_cache.read(DATA_FRUIT_DETAILS)
+
+@tool
+def query_fruits_details_json(selector: str, limit: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Returns only the part of fruits_details.json matching the selector, without reading the rest.
+    Selector examples: "Apple" for one fruit, "Apple.description" for one field, "$" for all fruits.
+    Objects and arrays are paged by limit. Pass the returned next_cursor to get the next page.
+    """
+    return _query(DATA_FRUIT_DETAILS, selector, limit, 0, cursor)
 
 @tool
 def edit_fruits_json(new_content: Dict[str, Any]) -> str:
     """
     Overwrites fruits.json with new content provided by the agent.
-    The new content must be valid JSON.
+    The new content must be valid JSON. For small changes use patch_fruits_json instead.
     """
-    try:
-        # Ensure content is valid JSON
-        json.dumps(new_content)  # This checks if it's serializable
-    except (TypeError, ValueError):
-        return "Error: The provided content is not valid JSON."
-
-    with open(DATA_FRUIT, "w", encoding="utf-8") as file:
-        json.dump(new_content, file, ensure_ascii=False, indent=4)
+    error = _overwrite(DATA_FRUIT, new_content)
+    if error:
+        return error
 
     return "Successfully updated fruits.json with new content."
 
@@ -66,16 +57,11 @@ def edit_fruits_json(new_content: Dict[str, Any]) -> str:
 def edit_fruits_details_json(new_content: Dict[str, Any]) -> str:
     """
     Overwrites fruits_details.json with new content provided by the agent.
-    The new content must be valid JSON.
+    The new content must be valid JSON. For small changes use merge_fruits_details_json or patch_fruits_details_json instead.
     """
-    try:
-        # Ensure content is valid JSON
-        json.dumps(new_content)  # This checks if it's serializable
-    except (TypeError, ValueError):
-        return "Error: The provided content is not valid JSON."
-
-    with open(DATA_FRUIT_DETAILS, "w", encoding="utf-8") as file:
-        json.dump(new_content, file, ensure_ascii=False, indent=4)
+    error = _overwrite(DATA_FRUIT_DETAILS, new_content)
+    if error:
+        return error
 
     return "Successfully updated fruits_details.json with new content."
 
@@ -90,15 +76,7 @@ def read_json(file_path: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: The JSON content as a dictionary, or an empty dict if the file does not exist or is invalid.
     """
-    if not os.path.exists(file_path):
-        return {}  # Return empty dictionary if file doesn't exist
-    
-    try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            data = json.load(file)
-            return data  # Return as a raw JSON dictionary
-    except json.JSONDecodeError:
-        return {}  # Return empty dictionary if JSON is invalid
+    return json_cache.read(file_path)
     
     
 @tool
@@ -113,15 +91,124 @@ def edit_json(file_path: str, new_content: Dict[str, Any]) -> str:
     Returns:
         str: Success or error message.
     """
+    error = _overwrite(file_path, new_content)
+    if error:
+        return error
+
+    return f"Successfully updated {file_path} with new content."
+
+
+@tool
+def query_json(file_path: str, selector: str = "$", limit: int = 20, offset: int = 0, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Returns only the part of a JSON file matching the selector, the file is stream-parsed instead of loaded whole.
+
+    Args:
+        file_path (str): The path of the JSON file to query.
+        selector (str): A key path like "Apple.description" or a JSONPath-style selector like "$.fruits[0]".
+        limit (int): How many children of a matched object or array to return.
+        offset (int): How many children to skip.
+        cursor (str): The next_cursor of a previous call, continues where that page ended.
+
+    Returns:
+        Dict[str, Any]: {"value": ...} for a single value, {"items": ..., "next_cursor": ...} for objects and arrays,
+            or {"error": ...} if nothing matches.
+    """
+    return _query(file_path, selector, limit, offset, cursor)
+
+
+@tool
+def patch_fruits_json(operations: List[Dict[str, Any]]) -> str:
+    """
+    Applies a JSON Patch (RFC 6902) to fruits.json, send only the changes instead of the whole file.
+    Each operation is an object like {"op": "add", "path": "/fruits/-", "value": "Mango"}.
+    Supported ops: add, remove, replace, move, copy, test. If one operation fails, nothing is written.
+    """
+    return _patch(DATA_FRUIT, operations)
+
+@tool
+def patch_fruits_details_json(operations: List[Dict[str, Any]]) -> str:
+    """
+    Applies a JSON Patch (RFC 6902) to fruits_details.json, send only the changes instead of the whole file.
+    Each operation is an object like {"op": "replace", "path": "/Apple/description", "value": "..."}.
+    Supported ops: add, remove, replace, move, copy, test. If one operation fails, nothing is written.
+    """
+    return _patch(DATA_FRUIT_DETAILS, operations)
+
+@tool
+def merge_fruits_details_json(patch: Dict[str, Any]) -> str:
+    """
+    Applies a JSON Merge Patch (RFC 7396) to fruits_details.json.
+    Send only the keys to add or change, e.g. {"Mango": {"name": "Mango", "description": "..."}}.
+    A key set to null is deleted.
+    """
+    return _merge(DATA_FRUIT_DETAILS, patch)
+
+@tool
+def patch_json(file_path: str, operations: List[Dict[str, Any]]) -> str:
+    """
+    Applies a JSON Patch (RFC 6902) to the specified JSON file.
+
+    Args:
+        file_path (str): The path of the JSON file to patch.
+        operations (List[Dict[str, Any]]): Operations like {"op": "add", "path": "/key", "value": ...},
+            supported ops are add, remove, replace, move, copy and test.
+
+    Returns:
+        str: Success or error message. If one operation fails, nothing is written.
+    """
+    return _patch(file_path, operations)
+
+@tool
+def merge_patch_json(file_path: str, patch: Dict[str, Any]) -> str:
+    """
+    Applies a JSON Merge Patch (RFC 7396) to the specified JSON file.
+
+    Args:
+        file_path (str): The path of the JSON file to patch.
+        patch (Dict[str, Any]): The keys to add or change, a key set to null is deleted.
+
+    Returns:
+        str: Success or error message.
+    """
+    return _merge(file_path, patch)
+
+
+def _query(file_path: str, selector: str, limit: int, offset: int, cursor: Optional[str]) -> Dict[str, Any]:
+    try:
+        return query_json_file(file_path, selector, limit, offset, cursor)
+    except FileNotFoundError:
+        return {"error": f"{file_path} does not exist."}
+    except JSONQueryError as e:
+        return {"error": str(e)}
+
+def _overwrite(file_path: str, new_content: Dict[str, Any]) -> Optional[str]:
+    """Replaces the file atomically under its lock, returns an error message on failure."""
     try:
-        # Ensure content is valid JSON
-        json.dumps(new_content)  # This checks if it's serializable
+        with locked(file_path):
+            write_json_atomic(file_path, new_content)
     except (TypeError, ValueError):
         return "Error: The provided content is not valid JSON."
+    except OSError as e:
+        return f"Error writing to file: {str(e)}"
+    return None
 
+def _patch(file_path: str, operations: List[Dict[str, Any]]) -> str:
     try:
-        with open(file_path, "w", encoding="utf-8") as file:
-            json.dump(new_content, file, ensure_ascii=False, indent=4)
-        return f"Successfully updated {file_path} with new content."
-    except Exception as e:
-        return f"Error writing to file: {str(e)}"
\ No newline at end of file
+        update_json(file_path, lambda content: apply_json_patch(content, operations))
+    except JSONPatchError as e:
+        return f"Error: {str(e)}"
+    except (TypeError, ValueError):
+        return f"Error: {file_path} or the patch is not valid JSON."
+    except OSError as e:
+        return f"Error writing to file: {str(e)}"
+    return f"Successfully applied {len(operations)} operation(s) to {file_path}."
+
+def _merge(file_path: str, patch: Dict[str, Any]) -> str:
+    try:
+        update_json(file_path, lambda content: apply_merge_patch(content, patch))
+    except (TypeError, ValueError):
+        return f"Error: {file_path} or the patch is not valid JSON."
+    except OSError as e:
+        return f"Error writing to file: {str(e)}"
+    return f"Successfully merged {len(patch)} key(s) into {file_path}."
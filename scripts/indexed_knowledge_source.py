@@ -0,0 +1,175 @@
+from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from crewai.utilities.paths import db_storage_path
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Type
+from pydantic import Field
+import hashlib
+import json
+import os
+import threading
+
+
+class FileManifest:
+    """On-disk record of the knowledge files that are already parsed, chunked and stored, per storage collection."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else Path(db_storage_path()) / "knowledge" / "file_manifest.json"
+        self._lock = threading.Lock()
+        # collection name -> resolved file path -> fingerprint and chunk ids
+        self._collections: Dict[str, Dict[str, Dict[str, Any]]] = self._load()
+        self._missing_checked: set = set()
+
+    def lookup(self, file: Path, collection: Optional[str] = None) -> Optional[List[str]]:
+        """Returns the stored chunk ids of an unchanged file, None if the file is new or changed.
+
+        Without a collection any collection's entry will do, the chunk ids only
+        depend on the file, but whether they are stored has to be checked against
+        the storage the file goes to.
+        """
+        key = str(Path(file).resolve())
+        names = [collection] if collection is not None else list(self._collections)
+        entries = [(name, self._collections.get(name, {}).get(key)) for name in names]
+        entries = [(name, entry) for name, entry in entries if entry]
+        if not entries:
+            return None
+
+        stat = os.stat(key)
+        for name, entry in entries:
+            if entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                return entry["chunk_ids"]
+
+        # Touched but maybe not modified, only the hash can tell
+        name, entry = entries[0]
+        if entry["size"] != stat.st_size or entry["sha256"] != self._hash_file(key):
+            return None
+
+        with self._lock:
+            entry["mtime_ns"] = stat.st_mtime_ns
+            self._save()
+        return entry["chunk_ids"]
+
+    def record(self, file: Path, collection: str, chunk_ids: List[str]) -> List[str]:
+        """Stores the fingerprint of a file together with the ids of its chunks stored in the collection.
+
+        Returns the ids of the file's previous chunks that no file recorded for the collection uses anymore.
+        """
+        key = str(Path(file).resolve())
+        stat = os.stat(key)
+        entry = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": self._hash_file(key),
+            "chunk_ids": chunk_ids,
+        }
+        with self._lock:
+            entries = self._collections.setdefault(collection, {})
+            previous = entries.get(key)
+            entries[key] = entry
+            self._save()
+            return self._unused(collection, previous["chunk_ids"] if previous else [])
+
+    def forget_missing(self, collection: str) -> List[str]:
+        """Drops the collection's entries of deleted files, once per manifest and collection.
+
+        Returns the ids of their chunks that no remaining file of the collection uses.
+        """
+        with self._lock:
+            if collection in self._missing_checked:
+                return []
+            self._missing_checked.add(collection)
+            entries = self._collections.get(collection, {})
+            missing = [key for key in entries if not os.path.exists(key)]
+            if not missing:
+                return []
+            dropped = [chunk_id for key in missing for chunk_id in entries.pop(key)["chunk_ids"]]
+            self._save()
+            return self._unused(collection, dropped)
+
+    def _unused(self, collection: str, chunk_ids: List[str]) -> List[str]:
+        # Identical chunks of different files share an id, those stay stored
+        used = {chunk_id for entry in self._collections.get(collection, {}).values() for chunk_id in entry["chunk_ids"]}
+        return [chunk_id for chunk_id in dict.fromkeys(chunk_ids) if chunk_id not in used]
+
+    def _load(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        # Manifests written before the entries were kept per collection are read as empty, the files are checked again
+        return data.get("collections", {}) if isinstance(data.get("collections"), dict) else {}
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({"collections": self._collections}, file)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+
+class IndexedFileKnowledgeSource(BaseKnowledgeSource):
+    """Knowledge source for a single file that is only parsed and embedded when its chunks are not stored yet.
+
+    chunks can be handed in already parsed, then only the embedding is left for add().
+    """
+
+    file_path: Path
+    source_class: Type[BaseFileKnowledgeSource]
+    chunk_ids: List[str] = Field(default_factory=list)
+    manifest: Optional[FileManifest] = Field(default=None, exclude=True)
+
+    def validate_content(self):
+        """Validate the file path."""
+        if not self.file_path.is_file():
+            raise FileNotFoundError(f"File not found: {self.file_path}")
+
+    def add(self) -> None:
+        """Skips files whose chunks are all in the storage, parses and stores the others.
+
+        Chunks of a changed file's previous version and of deleted files are removed from the storage.
+        """
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+
+        collection = self.storage.collection_name or "knowledge"
+        if self.manifest:
+            self._delete_chunks(self.manifest.forget_missing(collection))
+
+        if self.chunk_ids and self._is_stored():
+            # The loader's lookup may have matched another collection's entry, this one needs its own
+            if self.manifest and self.manifest.lookup(self.file_path, collection) is None:
+                self._delete_chunks(self.manifest.record(self.file_path, collection, self.chunk_ids))
+            return
+
+        if self.chunks:
+            # Already parsed and chunked, e.g. by the loader's worker processes
+            self._save_documents()
+            chunks = self.chunks
+        else:
+            source = self.source_class(file_paths=[self.file_path])
+            source.storage = self.storage
+            source.add()
+            chunks = source.chunks
+
+        self.chunk_ids = list(dict.fromkeys(hashlib.sha256(chunk.encode("utf-8")).hexdigest() for chunk in chunks))
+        if self.manifest:
+            self._delete_chunks(self.manifest.record(self.file_path, collection, self.chunk_ids))
+
+    def _delete_chunks(self, chunk_ids: List[str]) -> None:
+        if chunk_ids:
+            self.storage.collection.delete(ids=chunk_ids)
+            print(f"🧹 Removed {len(chunk_ids)} stale chunks from the knowledge storage")
+
+    def _is_stored(self) -> bool:
+        """Checks that every chunk of the file is in this source's storage collection."""
+        stored = self.storage.collection.get(ids=self.chunk_ids, include=[])
+        return len(stored["ids"]) == len(set(self.chunk_ids))
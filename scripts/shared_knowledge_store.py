@@ -0,0 +1,185 @@
+from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from lazy_knowledge import LazyKnowledgeStorage
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type
+from pydantic import Field
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+
+
+class _ChunkCollector:
+    """Stands in for the storage while a file is parsed (e.g. in a loader worker process) and keeps the chunks the source would save."""
+
+    def __init__(self):
+        self.chunks: List[str] = []
+
+    def save(self, documents: List[str], metadata=None) -> None:
+        self.chunks.extend(documents)
+
+
+class SharedKnowledgeStore:
+    """Content-addressed knowledge store in a directory shared by every crew on the machine.
+
+    Files are kept once under blobs/ by their sha256, and their chunks are embedded
+    once into a Chroma collection per embedding model under chroma/, tagged with the
+    blob hash. Crews reference the files by hash, so a file shipped by ten projects
+    is parsed, embedded and stored a single time.
+
+    The directory is CREWAI_SHARED_KNOWLEDGE_DIR, or ~/.crewai/shared_knowledge.
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root or os.getenv("CREWAI_SHARED_KNOWLEDGE_DIR") or Path.home() / ".crewai" / "shared_knowledge")
+        self._lock = threading.Lock()
+        self._client = None
+
+    def put(self, file_path: Path) -> str:
+        """Adds a file to the store if its content is not there yet, returns its hash."""
+        file_path = Path(file_path)
+        blob = self._hash_file(file_path)
+        target = self._blob_dir(blob) / f"{blob}{file_path.suffix.lower()}"
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+            os.close(fd)
+            shutil.copyfile(file_path, tmp_path)
+            os.replace(tmp_path, target)
+        return blob
+
+    def blob_path(self, blob: str) -> Path:
+        """Path of a stored file, the original suffix is kept for the parsers."""
+        matches = [path for path in self._blob_dir(blob).glob(f"{blob}*") if not path.name.startswith(".tmp-")]
+        if not matches:
+            raise FileNotFoundError(f"Blob not found in the shared knowledge store: {blob}")
+        return matches[0]
+
+    def collection(self, embedding_function: Any, embedder_key: str):
+        """The shared chunk collection of one embedding model."""
+        import chromadb
+
+        with self._lock:
+            if self._client is None:
+                self._client = chromadb.PersistentClient(path=str(self.root / "chroma"))
+            name = "shared_" + hashlib.sha256(embedder_key.encode("utf-8")).hexdigest()[:16]
+            return self._client.get_or_create_collection(name=name, embedding_function=embedding_function)
+
+    def ensure_embedded(self, collection, blob: str, source_class: Type[BaseFileKnowledgeSource]) -> bool:
+        """Parses and embeds a blob unless another crew already did, returns True if it was embedded now."""
+        if collection.get(where={"blob": blob}, limit=1, include=[])["ids"]:
+            return False
+
+        source = source_class(file_paths=[self.blob_path(blob)])
+        source.storage = _ChunkCollector()
+        source.add()
+        chunks = source.storage.chunks
+        if chunks:
+            # Ids are derived from the blob, so crews embedding the same blob at once just overwrite each other
+            collection.upsert(
+                ids=[f"{blob}:{index}" for index in range(len(chunks))],
+                documents=chunks,
+                metadatas=[{"blob": blob} for _ in chunks],
+            )
+        return True
+
+    def _blob_dir(self, blob: str) -> Path:
+        return self.root / "blobs" / blob[:2]
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+
+class SharedStoreKnowledgeStorage(LazyKnowledgeStorage):
+    """Lazy knowledge storage that searches the project's own collection and the shared store together.
+
+    Content-addressed sources land in the shared collection, everything else
+    (e.g. ChromaDB directories) in the project collection as before. A search only
+    sees the shared chunks of the blobs this storage references.
+    """
+
+    def __init__(self, store: SharedKnowledgeStore, embedder: Optional[Dict[str, Any]] = None, collection_name: Optional[str] = None):
+        super().__init__(embedder=embedder, collection_name=collection_name)
+        self.store = store
+        self.embedder_key = self._embedder_key(embedder)
+        self.shared_collection = None
+        self._blobs: set = set()
+
+    def add_blob(self, blob: str, source_class: Type[BaseFileKnowledgeSource]) -> None:
+        with self._lock:
+            self._ensure_initialized()
+            if self.store.ensure_embedded(self.shared_collection, blob, source_class):
+                print(f"🧩 Embedded into the shared store: {blob[:12]}")
+            else:
+                print(f"♻️ Already in the shared store: {blob[:12]}")
+            self._blobs.add(blob)
+
+    def search(self, query: List[str], limit: int = 3, filter: Optional[dict] = None, score_threshold: float = 0.35) -> List[Dict[str, Any]]:
+        results = super().search(query, limit, filter, score_threshold)
+        if not self._blobs:
+            return results
+
+        where = {"blob": {"$in": sorted(self._blobs)}}
+        if filter:
+            where = {"$and": [where, filter]}
+        fetched = self.shared_collection.query(query_texts=query, n_results=limit, where=where)
+        for record_id, metadata, document, distance in zip(
+            fetched["ids"][0], fetched["metadatas"][0], fetched["documents"][0], fetched["distances"][0]
+        ):
+            # Same score rule as KnowledgeStorage.search
+            if distance >= score_threshold:
+                results.append({"id": record_id, "metadata": metadata, "context": document, "score": distance})
+
+        return sorted(results, key=lambda result: result["score"])[:limit]
+
+    def _ensure_initialized(self) -> None:
+        with self._lock:
+            if not self._initialized:
+                super()._ensure_initialized()
+                self.shared_collection = self.store.collection(self.embedder, self.embedder_key)
+
+    @staticmethod
+    def _embedder_key(embedder: Optional[Dict[str, Any]]) -> str:
+        """Names the embedding model the same way in every process, so crews with the same model share vectors."""
+        if not embedder:
+            return "openai:text-embedding-3-small"
+        provider = embedder.get("provider")
+        if provider == "custom":
+            # {"provider": "custom", "config": {"embedder": <embedding function>}}
+            provider = embedder.get("config", {}).get("embedder")
+        elif isinstance(provider, str):
+            return f"{provider}:{embedder.get('config', {}).get('model')}"
+        # Embedding function objects, e.g. CachedEmbeddingFunction
+        return f"{getattr(provider, 'provider', type(provider).__name__)}:{getattr(provider, 'model', None)}"
+
+
+class ContentAddressedKnowledgeSource(BaseKnowledgeSource):
+    """Knowledge source referencing a file of the shared store by its hash."""
+
+    blob: str
+    source_class: Type[BaseFileKnowledgeSource]
+    store: SharedKnowledgeStore = Field(default_factory=SharedKnowledgeStore, exclude=True)
+
+    def validate_content(self):
+        """Check that the blob is in the store."""
+        self.store.blob_path(self.blob)
+
+    def add(self) -> None:
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+
+        if isinstance(self.storage, SharedStoreKnowledgeStorage):
+            self.storage.add_blob(self.blob, self.source_class)
+            return
+
+        # Any other storage gets its own copy of the chunks
+        source = self.source_class(file_paths=[self.store.blob_path(self.blob)])
+        source.storage = self.storage
+        source.add()
@@ -0,0 +1,162 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from crewai import Crew
+from crewai.types.usage_metrics import UsageMetrics
+
+
+class RateLimiter:
+    """Token bucket shared by every worker calling the same provider.
+
+    rate is requests per minute, burst how many may start at once after an idle period.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.interval = 60.0 / rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) / self.interval)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.interval
+            time.sleep(wait)
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one input, error is set instead of output when its kickoff failed."""
+
+    index: int
+    inputs: Dict[str, Any]
+    output: Any = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "inputs": self.inputs,
+            "output": str(self.output) if self.output is not None else None,
+            "error": self.error,
+            "seconds": round(self.seconds, 3),
+        }
+
+
+def provider_of(model: str) -> str:
+    """litellm provider prefix of a model name, bare names go to OpenAI."""
+    return model.split("/", 1)[0] if "/" in model else "openai"
+
+
+class BatchRunner:
+    """Bounded-concurrency replacement for Crew.kickoff_for_each.
+
+    Every input runs on its own copy of the crew in a pool of `workers` threads.
+    LLM calls of all copies go through one RateLimiter per provider (requests
+    per minute in rate_limits, e.g. {"openai": 500}), so adding workers never
+    pushes the batch over the provider's quota. A failing input is recorded in
+    its BatchResult and the rest of the batch goes on. Tasks asking for
+    human_input run without it, concurrent workers cannot share one terminal.
+
+    run() returns the results in input order. Each finished input is passed to
+    on_result(result, done, total) and, with results_path, appended to a JSONL
+    file, so a long nightly batch can be followed and its partial results kept.
+    """
+
+    def __init__(
+        self,
+        crew: Crew,
+        workers: int = 4,
+        rate_limits: Optional[Dict[str, float]] = None,
+        on_result: Optional[Callable[[BatchResult, int, int], None]] = None,
+        results_path: Optional[str] = None,
+    ):
+        self.crew = crew
+        self.workers = workers
+        self.limiters = {provider: RateLimiter(rate, burst=max(1, workers)) for provider, rate in (rate_limits or {}).items()}
+        self.on_result = on_result or self._print_progress
+        self.results_path = results_path
+        self.usage_metrics = UsageMetrics()
+        self._lock = threading.Lock()
+
+    def run(self, inputs: List[Dict[str, Any]]) -> List[BatchResult]:
+        prompting = [task.name or task.description[:40] for task in self.crew.tasks if task.human_input]
+        if prompting:
+            print(f"⚠️ Running {', '.join(prompting)} without human input, the batch cannot prompt on stdin")
+        results: List[Optional[BatchResult]] = [None] * len(inputs)
+        self.usage_metrics = UsageMetrics()
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="batch") as executor:
+            futures = [executor.submit(self._run_one, index, input_data) for index, input_data in enumerate(inputs)]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.index] = result
+                done += 1
+                self._save(result)
+                self.on_result(result, done, len(inputs))
+
+        return results
+
+    def _run_one(self, index: int, input_data: Dict[str, Any]) -> BatchResult:
+        start = time.perf_counter()
+        try:
+            crew = self.crew.copy()
+            for task in crew.tasks:
+                task.human_input = False
+            self._rate_limit(crew)
+            output = crew.kickoff(inputs=input_data)
+        except Exception as e:
+            return BatchResult(index, input_data, error=f"{type(e).__name__}: {e}", seconds=time.perf_counter() - start)
+
+        if crew.usage_metrics:
+            with self._lock:
+                self.usage_metrics.add_usage_metrics(crew.usage_metrics)
+        return BatchResult(index, input_data, output=output, seconds=time.perf_counter() - start)
+
+    def _rate_limit(self, crew: Crew) -> None:
+        """Puts the provider's limiter in front of the LLM calls of the copied agents."""
+        if not self.limiters:
+            return
+        for agent in crew.agents:
+            llm = agent.llm
+            if llm is None or getattr(llm, "_batch_limited", False):
+                continue
+            limiter = self.limiters.get(provider_of(str(getattr(llm, "model", ""))))
+            if limiter is None:
+                continue
+            call = llm.call
+
+            def limited_call(*args, _call=call, _limiter=limiter, **kwargs):
+                _limiter.acquire()
+                return _call(*args, **kwargs)
+
+            llm.call = limited_call
+            llm._batch_limited = True
+
+    def _save(self, result: BatchResult) -> None:
+        if not self.results_path:
+            return
+        with open(self.results_path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(result.to_dict()) + "\n")
+
+    @staticmethod
+    def _print_progress(result: BatchResult, done: int, total: int) -> None:
+        status = "✅" if result.ok else f"❌ {result.error}"
+        print(f"[{done}/{total}] {result.inputs} {status} ({result.seconds:.1f}s)")
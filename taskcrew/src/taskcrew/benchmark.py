@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+import os
+import sys
+import time
+
+# The fake crew must not send telemetry home
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+from crewai import LLM, Agent, Crew, Process, Task
+
+from taskcrew.batch import BatchRunner
+
+# Compares the sequential kickoff_for_each loop with the BatchRunner on a crew
+# whose LLM is a local fake answering after a fixed latency.
+# Usage: benchmark [topics] [workers] [latency s] [rate per minute], e.g. benchmark 200 16 0.5 6000
+
+
+class FakeLLM(LLM):
+    """LLM answering every call with a canned final answer after `latency` seconds."""
+
+    def __init__(self, latency: float = 0.5, model: str = "openai/fake-model"):
+        super().__init__(model=model)
+        self.latency = latency
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None) -> str:
+        time.sleep(self.latency)
+        return "Thought: I now know the final answer\nFinal Answer: A short blog post about the topic."
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def supports_stop_words(self) -> bool:
+        return False
+
+    def get_context_window_size(self) -> int:
+        return 8192
+
+
+def fake_crew(latency: float) -> Crew:
+    writer = Agent(
+        role="Blog writer",
+        goal="Write a short blog post about {topic}",
+        backstory="A writer used to benchmark crews.",
+        llm=FakeLLM(latency),
+        verbose=False,
+    )
+    task = Task(
+        description="Write a short blog post about {topic}.",
+        expected_output="A short blog post.",
+        agent=writer,
+    )
+    return Crew(agents=[writer], tasks=[task], process=Process.sequential, verbose=False)
+
+
+def run():
+    """
+    Run the batch runner benchmark.
+    """
+    topics = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    latency = float(sys.argv[3]) if len(sys.argv) > 3 else 0.5
+    rate = float(sys.argv[4]) if len(sys.argv) > 4 else None
+    data = [{"topic": f"Topic {i}"} for i in range(topics)]
+    crew = fake_crew(latency)
+
+    start = time.perf_counter()
+    crew.kickoff_for_each(inputs=data)
+    sequential = time.perf_counter() - start
+
+    runner = BatchRunner(
+        crew,
+        workers=workers,
+        rate_limits={"openai": rate} if rate else None,
+        on_result=lambda result, done, total: None,
+    )
+    start = time.perf_counter()
+    results = runner.run(data)
+    batched = time.perf_counter() - start
+    failed = sum(1 for result in results if not result.ok)
+
+    print(f"{'runner':<12} {'topics':>7} {'workers':>8} {'wall s':>9} {'topics/s':>9} {'failed':>7}")
+    print(f"{'sequential':<12} {topics:>7} {1:>8} {sequential:>9.2f} {topics / sequential:>9.2f} {0:>7}")
+    print(f"{'batch':<12} {topics:>7} {workers:>8} {batched:>9.2f} {topics / batched:>9.2f} {failed:>7}")
+    print(f"speed-up: {sequential / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    run()
@@ -7,6 +7,11 @@ from crewai.tasks.task_output import TaskOutput
 from crewai.project import CrewBase, agent, crew, task, after_kickoff
 from datetime import datetime
 import os
+from taskcrew.lazy_agent import LazyAgent, lazy_setup_report
+from taskcrew.review_queue import ReviewTask
+
+# HUMAN_REVIEW=queue queues the blog draft for review (see taskcrew.review) instead of waiting on stdin
+REVIEW_QUEUE = os.getenv("HUMAN_REVIEW", "stdin").lower() == "queue"
 
 # Define an output model to capture the research task output
 class BulletPointOutput(BaseModel):
@@ -24,6 +29,10 @@ class Taskcrew:
     agents_config = 'config/agents.yaml'
     tasks_config = 'config/tasks.yaml'
     output_file = "outputs/blog_post.md"
+    # Set on an instance to force the review queue, e.g. when resuming reviews or running batches
+    review_queue = REVIEW_QUEUE
+    # Off for batches: the per-input crew copies run their own agents, the report would only see these
+    report_setup = True
 
     # Agent Definitions
     @agent
@@ -33,9 +42,10 @@ class Taskcrew:
             verbose=True
         )
 
+    # Only needed when data_processor_task's condition holds, its setup waits until then
     @agent
     def data_processor(self) -> Agent:
-        return Agent(
+        return LazyAgent(
             config=self.agents_config['data_processor'],
             verbose=True
         )
@@ -66,6 +76,12 @@ class Taskcrew:
 
     @task
     def blog_writer_task(self) -> Task:
+        if self.review_queue:
+            # Only approved drafts are written to the output file, by `review resume`
+            return ReviewTask(
+                config=self.tasks_config['blog_writer_task'],
+                review_output_file=self.output_file,
+            )
         return Task(
             config=self.tasks_config['blog_writer_task'],
             output_file=self.output_file,
@@ -73,6 +89,18 @@ class Taskcrew:
         )
 
 
+    @after_kickoff
+    def report_lazy_setup(self, output):
+        if not self.report_setup:
+            return output
+        report = lazy_setup_report(self.agents)
+        for role, seconds in report["set_up"].items():
+            print(f"⚙️ Set up {role} in {seconds:.2f}s")
+        for role, seconds in report["skipped"].items():
+            estimate = f"~{seconds:.2f}s" if seconds is not None else "time unknown until it runs once"
+            print(f"⏭️ Skipped setup of {role} ({estimate})")
+        return output
+
     # Crew Definition
     @crew
     def crew(self) -> Crew:
@@ -0,0 +1,92 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from crewai import Agent
+from crewai.task import Task
+from crewai.tools import BaseTool
+from pydantic import PrivateAttr, model_validator
+
+# Setup seconds measured per agent role, used to estimate what a skipped setup would have cost
+_setup_history: Dict[str, float] = {}
+_history_lock = threading.Lock()
+
+
+class LazyAgent(Agent):
+    """Agent that builds its knowledge, LLM client, cache handler and executor when it first runs a task.
+
+    Meant for agents of ConditionalTasks: when the condition is false the task
+    is skipped and so is all of the agent's setup. The crew still calls
+    create_agent_executor on every agent at kickoff, that call is a no-op until
+    the agent is set up. See lazy_setup_report() for what was skipped.
+    """
+
+    _ready: bool = PrivateAttr(default=False)
+    _setup_seconds: Optional[float] = PrivateAttr(default=None)
+    _setup_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @model_validator(mode="after")
+    def post_init_setup(self):
+        # Replaces Agent.post_init_setup at construction, it runs in ensure_ready()
+        self.agent_ops_agent_name = self.role
+        return self
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready
+
+    @property
+    def setup_seconds(self) -> Optional[float]:
+        return self._setup_seconds
+
+    def ensure_ready(self) -> None:
+        """Runs the deferred setup once."""
+        with self._setup_lock:
+            if self._ready:
+                return
+            start = time.perf_counter()
+            super().post_init_setup()
+            self._setup_seconds = time.perf_counter() - start
+            self._ready = True
+        with _history_lock:
+            _setup_history[self.role] = self._setup_seconds
+
+    def create_agent_executor(self, tools: Optional[List[BaseTool]] = None, task: Optional[Task] = None) -> None:
+        if not self._ready:
+            return
+        if self.agent_executor is not None:
+            super().create_agent_executor(tools=tools, task=task)
+            return
+        # The first executor is part of the setup time
+        start = time.perf_counter()
+        super().create_agent_executor(tools=tools, task=task)
+        self._setup_seconds += time.perf_counter() - start
+        with _history_lock:
+            _setup_history[self.role] = self._setup_seconds
+
+    def execute_task(self, task: Task, context: Optional[str] = None, tools: Optional[List[BaseTool]] = None) -> str:
+        self.ensure_ready()
+        return super().execute_task(task, context, tools)
+
+
+def lazy_setup_report(agents: List[Any]) -> Dict[str, Any]:
+    """Which lazy agents were set up during a kickoff, which were skipped and the setup time saved.
+
+    A skipped agent's setup time is estimated from an earlier setup of the same
+    role in this process, or from the mean of all measured setups.
+    """
+    with _history_lock:
+        history = dict(_setup_history)
+    mean = sum(history.values()) / len(history) if history else None
+
+    report: Dict[str, Any] = {"set_up": {}, "skipped": {}, "skipped_seconds": 0.0}
+    for agent in agents:
+        if not isinstance(agent, LazyAgent):
+            continue
+        if agent.is_ready:
+            report["set_up"][agent.role] = agent.setup_seconds
+            continue
+        estimate = history.get(agent.role, mean)
+        report["skipped"][agent.role] = estimate
+        report["skipped_seconds"] += estimate or 0.0
+    return report
@@ -4,6 +4,7 @@ import warnings
 
 from datetime import datetime
 
+from taskcrew.batch import BatchRunner
 from taskcrew.crew import Taskcrew
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
@@ -28,12 +29,40 @@ def run():
     ]
     
     try:
-        # result = Taskcrew().crew().kickoff_for_each(inputs=data)
+        # To run every topic of data, see run_batch
         result = Taskcrew().crew().kickoff(inputs=inputs)
         print(result)
     except Exception as e:
         raise Exception(f"An error occurred while running the crew: {e}")
 
+def run_batch():
+    """
+    Run the crew for every topic, a few at a time.
+    """
+    data = [
+        { 'topic': "Apple" },
+        { 'topic': "Banana" },
+        { 'topic': "Orange" },
+    ]
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+
+    # Workers share one stdin, drafts go to the review queue instead (see taskcrew.review)
+    taskcrew = Taskcrew()
+    taskcrew.review_queue = True
+    taskcrew.report_setup = False
+
+    try:
+        results = BatchRunner(
+            taskcrew.crew(),
+            workers=workers,
+            rate_limits={"openai": 500},
+            results_path="outputs/batch_results.jsonl",
+        ).run(data)
+        for result in results:
+            print(result.output if result.ok else f"{result.inputs['topic']} failed: {result.error}")
+    except Exception as e:
+        raise Exception(f"An error occurred while running the batch: {e}")
+
 def train():
     """
     Train the crew for a given number of iterations.
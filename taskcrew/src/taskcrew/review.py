@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+import argparse
+import os
+import time
+from datetime import datetime
+from typing import Optional
+
+from crewai.utilities import I18N
+
+from taskcrew.review_queue import (
+    APPROVED,
+    CHANGES_REQUESTED,
+    DONE,
+    PENDING,
+    RESUMED,
+    Review,
+    ReviewQueue,
+    ReviewTask,
+)
+
+# Reviews drafts queued by ReviewTask (HUMAN_REVIEW=queue) and resumes the crew from their checkpoints.
+# Usage:
+#   review list [--all]            pending and answered reviews
+#   review show ID                 draft and feedback of a review
+#   review approve ID              accept the draft as it is
+#   review comment ID "feedback"   ask for a revision
+#   review resume [ID]             write out approved drafts, revise commented ones
+#   review watch [--interval 30]   resume reviews as soon as they are answered
+
+
+def _summary(review: Review) -> str:
+    created = datetime.fromtimestamp(review.created_at).strftime("%Y-%m-%d %H:%M")
+    inputs = ", ".join(f"{key}={value}" for key, value in review.checkpoint.get("inputs", {}).items())
+    first_line = review.draft.strip().splitlines()[0][:60] if review.draft.strip() else ""
+    return f"#{review.id:<5} {review.status:<18} {created}  {review.task_name} ({inputs}) round {review.checkpoint.get('round', 1)}  {first_line}"
+
+
+def finalize(review: Review) -> None:
+    """Writes an approved draft where the task would have written its output."""
+    output_file = review.checkpoint.get("output_file")
+    if output_file:
+        directory = os.path.dirname(output_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(output_file, "w", encoding="utf-8") as file:
+            file.write(review.draft)
+    print(f"✅ Review #{review.id} approved" + (f", written to {output_file}" if output_file else ""))
+
+
+def revise(queue: ReviewQueue, review: Review) -> Optional[int]:
+    """Re-runs the reviewed task from its checkpoint with the reviewer's feedback, queues the new draft."""
+    from taskcrew.crew import Taskcrew
+
+    # The review task is needed whatever HUMAN_REVIEW says in this process
+    taskcrew = Taskcrew()
+    taskcrew.review_queue = True
+    crew = taskcrew.crew()
+    task = next((task for task in crew.tasks if task.name == review.task_name), None)
+    if not isinstance(task, ReviewTask):
+        print(f"❌ Review #{review.id}: the crew has no review task named {review.task_name}")
+        return None
+
+    inputs = review.checkpoint.get("inputs", {})
+    crew._inputs = inputs
+    crew._interpolate_inputs(inputs)
+    task.agent.crew = crew
+    task.review_queue_path = queue.path
+    task.review_round = review.checkpoint.get("round", 1) + 1
+
+    # Same feedback message the human_input prompt would add to the conversation
+    feedback = I18N().slice("feedback_instructions").format(feedback=review.feedback)
+    context = "\n\n----------\n\n".join(
+        part for part in (review.checkpoint.get("context"), f"Previous draft:\n{review.draft}", feedback) if part
+    )
+    task.execute_sync(agent=task.agent, context=context)
+    return task.last_review_id
+
+
+def resume(queue: ReviewQueue, review_id: Optional[int] = None) -> int:
+    """Continues every answered review (or just review_id), returns how many were handled."""
+    reviews = [queue.get(review_id)] if review_id else queue.list([APPROVED, CHANGES_REQUESTED])
+    handled = 0
+    for review in reviews:
+        if review is None or review.status not in (APPROVED, CHANGES_REQUESTED):
+            print(f"⏳ Review #{review_id} has no answer to resume from")
+            continue
+        if review.status == APPROVED:
+            if queue.claim(review.id, DONE):
+                finalize(review)
+                handled += 1
+        elif queue.claim(review.id, RESUMED):
+            print(f"🔁 Revising review #{review.id} with feedback: {review.feedback}")
+            try:
+                next_review = revise(queue, review)
+            except Exception as e:
+                print(f"❌ Review #{review.id}: revision failed: {e}")
+                next_review = None
+            if next_review:
+                queue.link(review.id, next_review)
+                handled += 1
+            else:
+                # Keeps the feedback, the review can be resumed again
+                queue.release(review.id)
+    return handled
+
+
+def run():
+    """
+    Review queued drafts.
+    """
+    parser = argparse.ArgumentParser(prog="review", description="Review drafts queued by the crew.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    listing = commands.add_parser("list", help="pending and answered reviews")
+    listing.add_argument("--all", action="store_true", help="include finished reviews")
+    commands.add_parser("show", help="draft and feedback of a review").add_argument("id", type=int)
+    commands.add_parser("approve", help="accept a draft").add_argument("id", type=int)
+    comment = commands.add_parser("comment", help="ask for a revision")
+    comment.add_argument("id", type=int)
+    comment.add_argument("feedback")
+    commands.add_parser("resume", help="continue answered reviews").add_argument("id", type=int, nargs="?")
+    commands.add_parser("watch", help="resume reviews as they are answered").add_argument("--interval", type=float, default=30)
+    args = parser.parse_args()
+
+    queue = ReviewQueue()
+    if args.command == "list":
+        reviews = queue.list(None if args.all else [PENDING, APPROVED, CHANGES_REQUESTED])
+        for review in reviews:
+            print(_summary(review))
+        if not reviews:
+            print("No reviews waiting.")
+    elif args.command == "show":
+        review = queue.get(args.id)
+        if review is None:
+            raise SystemExit(f"No review #{args.id}")
+        print(_summary(review))
+        if review.feedback:
+            print(f"\nFeedback: {review.feedback}")
+        print(f"\n{review.draft}")
+    elif args.command == "approve":
+        print(f"👍 Approved #{args.id}" if queue.approve(args.id) else f"Review #{args.id} is not pending")
+    elif args.command == "comment":
+        print(f"💬 Feedback recorded for #{args.id}" if queue.comment(args.id, args.feedback) else f"Review #{args.id} is not pending")
+    elif args.command == "resume":
+        print(f"Resumed {resume(queue, args.id)} review(s).")
+    elif args.command == "watch":
+        print(f"👀 Watching {queue.path}, Ctrl+C to stop")
+        while True:
+            resume(queue)
+            time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    run()
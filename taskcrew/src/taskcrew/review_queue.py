@@ -0,0 +1,193 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from crewai.task import Task
+from crewai.tasks.task_output import TaskOutput
+from pydantic import Field, PrivateAttr
+
+REVIEW_QUEUE_PATH = os.getenv("REVIEW_QUEUE_PATH", "outputs/reviews.sqlite3")
+
+PENDING = "pending"
+APPROVED = "approved"
+CHANGES_REQUESTED = "changes_requested"
+DONE = "done"
+RESUMED = "resumed"
+
+
+@dataclass
+class Review:
+    id: int
+    task_name: str
+    status: str
+    draft: str
+    feedback: Optional[str]
+    checkpoint: Dict[str, Any]
+    created_at: float
+    updated_at: float
+    next_review: Optional[int] = None
+
+
+class ReviewQueue:
+    """Local SQLite queue of drafts waiting for a human, with the checkpoint each one resumes from.
+
+    Status flow: pending -> approved or changes_requested (a reviewer answered)
+    -> done (approved draft written out) or resumed (revised, the new draft is
+    the pending review next_review). A failed revision goes back to changes_requested.
+    """
+
+    def __init__(self, path: str = REVIEW_QUEUE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS reviews (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    task_name TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    draft TEXT NOT NULL,
+                    feedback TEXT,
+                    checkpoint TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    next_review INTEGER
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS reviews_status ON reviews (status)")
+            self._conn.commit()
+        return self._conn
+
+    def enqueue(self, task_name: str, draft: str, checkpoint: Dict[str, Any]) -> int:
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO reviews (task_name, status, draft, checkpoint, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (task_name, PENDING, draft, json.dumps(checkpoint), now, now),
+            )
+            return cursor.lastrowid
+
+    def get(self, review_id: int) -> Optional[Review]:
+        with self._lock:
+            row = self._connect().execute("SELECT * FROM reviews WHERE id = ?", (review_id,)).fetchone()
+        return self._review(row) if row else None
+
+    def list(self, statuses: Optional[List[str]] = None) -> List[Review]:
+        query, params = "SELECT * FROM reviews", []
+        if statuses:
+            query += f" WHERE status IN ({', '.join('?' for _ in statuses)})"
+            params = list(statuses)
+        with self._lock:
+            rows = self._connect().execute(query + " ORDER BY id", params).fetchall()
+        return [self._review(row) for row in rows]
+
+    def approve(self, review_id: int) -> bool:
+        return self._answer(review_id, APPROVED, None)
+
+    def comment(self, review_id: int, feedback: str) -> bool:
+        return self._answer(review_id, CHANGES_REQUESTED, feedback)
+
+    def _answer(self, review_id: int, status: str, feedback: Optional[str]) -> bool:
+        """Records a reviewer's answer, only pending reviews can be answered."""
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE reviews SET status = ?, feedback = ?, updated_at = ? WHERE id = ? AND status = ?",
+                (status, feedback, time.time(), review_id, PENDING),
+            )
+            return cursor.rowcount > 0
+
+    def claim(self, review_id: int, status: str) -> bool:
+        """Moves an answered review to its final status, False if another worker got it first."""
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE reviews SET status = ?, updated_at = ? WHERE id = ? AND status IN (?, ?)",
+                (status, time.time(), review_id, APPROVED, CHANGES_REQUESTED),
+            )
+            return cursor.rowcount > 0
+
+    def release(self, review_id: int) -> bool:
+        """Puts a review whose revision failed back to changes_requested, so it can be resumed again."""
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE reviews SET status = ?, updated_at = ? WHERE id = ? AND status = ?",
+                (CHANGES_REQUESTED, time.time(), review_id, RESUMED),
+            )
+            return cursor.rowcount > 0
+
+    def link(self, review_id: int, next_review: int) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute("UPDATE reviews SET next_review = ? WHERE id = ?", (next_review, review_id))
+
+    @staticmethod
+    def _review(row) -> Review:
+        review_id, task_name, status, draft, feedback, checkpoint, created_at, updated_at, next_review = row
+        return Review(review_id, task_name, status, draft, feedback, json.loads(checkpoint), created_at, updated_at, next_review)
+
+
+class ReviewTask(Task):
+    """Task whose output goes to a ReviewQueue instead of a blocking human_input prompt.
+
+    When the task finishes, its draft is queued together with a checkpoint
+    (the kickoff inputs and the context the task ran with) and the crew goes
+    on, so the worker is free right away. The draft stays the task output until
+    a reviewer answers, taskcrew.review then writes out approved drafts or
+    re-runs just this task from the checkpoint with the reviewer's feedback.
+    Set review_output_file rather than output_file: only approved drafts are
+    written there, output_file would get every unreviewed draft.
+    Meant for the last task of a crew, later tasks would read the unreviewed draft.
+    """
+
+    review_queue_path: str = Field(default=REVIEW_QUEUE_PATH, description="SQLite file of the review queue")
+    review_round: int = Field(default=1, description="How many drafts of this task were reviewed so far, plus one")
+    review_output_file: Optional[str] = Field(default=None, description="Where the approved draft is written, may use {inputs}")
+
+    _depth: int = PrivateAttr(default=0)
+    _last_review_id: Optional[int] = PrivateAttr(default=None)
+
+    @property
+    def last_review_id(self) -> Optional[int]:
+        """Id of the review queued by the last execution."""
+        return self._last_review_id
+
+    def _execute_core(self, agent, context: Optional[str], tools: Optional[List[Any]]) -> TaskOutput:
+        # Guardrail retries re-enter _execute_core, only the outermost call queues the draft
+        self._depth += 1
+        try:
+            output = super()._execute_core(agent, context, tools)
+        finally:
+            self._depth -= 1
+
+        if self._depth == 0:
+            crew = getattr(self.agent, "crew", None)
+            inputs = getattr(crew, "_inputs", None) or {}
+            output_file = self.review_output_file
+            if output_file and inputs:
+                output_file = self.interpolate_only(input_string=output_file, inputs=inputs)
+            checkpoint = {
+                "inputs": inputs,
+                "context": self.prompt_context,
+                "output_file": output_file,
+                "round": self.review_round,
+            }
+            self._last_review_id = ReviewQueue(self.review_queue_path).enqueue(self.name or self.description, output.raw, checkpoint)
+            print(f"📝 Draft queued for review #{self._last_review_id} ({self.name}), run `review list` to see it")
+        return output
+
+    def copy(self, agents, task_mapping) -> "ReviewTask":
+        copied = super().copy(agents, task_mapping)
+        # Task.copy always builds a plain Task
+        return type(self)(
+            **{name: getattr(copied, name) for name in copied.model_fields_set},
+            review_queue_path=self.review_queue_path,
+            review_round=self.review_round,
+            review_output_file=self.review_output_file,
+        )
@@ -1,6 +1,11 @@
 from crewai import Agent, Crew, Process, Task
-from crewai.project import CrewBase, agent, crew, task
-from tools.tools.math_tool import multiplication_tool
+from crewai.project import CrewBase, agent, crew, task, after_kickoff
+from tools.tools.math_tool import multiplication_tool, multiplication_tool_batch
+from tools.tools.result_cache import PersistentCacheHandler, tool_versions
+
+# Tool results outlive the kickoff and are shared by every process using the same file,
+# multiplication_tool.cache_function still decides which results are stored, for the batch tool too
+tool_cache = PersistentCacheHandler(versions=tool_versions([multiplication_tool, multiplication_tool_batch]))
 
 # If you want to run a snippet of code before or after the crew starts, 
 # you can use the @before_kickoff and @after_kickoff decorators
@@ -18,7 +23,8 @@ class Tools():
 		return Agent(
 			config=self.agents_config['writer'],
 			verbose=True,
-			tools=[multiplication_tool],
+			tools=[multiplication_tool, multiplication_tool_batch],
+			cache_handler=tool_cache,
 		)
 
 	@task
@@ -28,6 +34,11 @@ class Tools():
 			output_file='outputs/homework.md',
 		)
 
+	@after_kickoff
+	def report_cache_stats(self, output):
+		print(f"🗄️ Tool cache: {tool_cache.stats()}")
+		return output
+
 	@crew
 	def crew(self) -> Crew:
 		"""Creates the Tools crew"""
@@ -36,6 +47,7 @@ class Tools():
 			tasks=self.tasks, # Automatically created by the @task decorator
 			process=Process.sequential,
 			verbose=True,
+			cache=False, # The crew's own cache would replace tool_cache on the agents
 			output_log_file="C:/melo/cyex/crewai_test_limits/tool/outputs/log.txt",
 			step_callback=lambda step_output: print(f"Step output: {step_output.__dict__}"),
 			task_callback=lambda task_output: print(f"Task output: {task_output}"),
@@ -0,0 +1,120 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from crewai.tools import BaseTool, tool
+from pydantic import ValidationError
+
+MAX_BATCH_SIZE = 1000
+
+# Integer columns are int64 on every platform (NumPy 1.x defaults to int32 on Windows). Beyond this
+# limit values go to NumPy as Python objects, so the product of two values stays exact instead of
+# overflowing int64
+_INT_DTYPE = np.int64
+_EXACT_INT_LIMIT = int(np.iinfo(_INT_DTYPE).max ** 0.5)
+
+
+def batch_tool(
+    single: BaseTool,
+    vectorized: Optional[Callable[..., Any]] = None,
+    max_workers: int = 8,
+    name: Optional[str] = None,
+) -> BaseTool:
+    """Batch version of a tool: one action runs a whole list of argument sets.
+
+    The agent sends {"calls": [{...}, {...}, ...]} and gets back one JSON list
+    with a result (or an error) per argument set, in order, instead of spending
+    an LLM iteration on every call. Each argument set is validated with the
+    single tool's schema.
+
+    With vectorized, the valid argument sets run as a single call getting one
+    NumPy array per argument, in the tool's argument order (e.g. np.multiply for
+    a two-number multiplication). Without it, or when the vectorized call fails,
+    they run on a thread pool through the single tool.
+
+    A batch is only cached when the single tool's cache_function agrees for
+    every result in it.
+    """
+    batch_name = name or f"{single.name}_batch"
+    fields = list(single.args_schema.model_fields)
+
+    def run_batch(calls: List[Dict[str, Any]]) -> str:
+        if len(calls) > MAX_BATCH_SIZE:
+            return f"Error: at most {MAX_BATCH_SIZE} calls per batch, got {len(calls)}"
+
+        results: List[Dict[str, Any]] = []
+        valid: List[int] = []
+        for call in calls:
+            try:
+                args = single.args_schema(**call).model_dump()
+            except ValidationError as e:
+                problems = "; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors())
+                results.append({"args": call, "error": f"Invalid arguments: {problems}"})
+                continue
+            except TypeError as e:
+                results.append({"args": call, "error": f"Invalid arguments: {e}"})
+                continue
+            valid.append(len(results))
+            results.append({"args": args})
+
+        outputs = _run_vectorized(vectorized, fields, [results[i]["args"] for i in valid]) if vectorized and valid else None
+        if outputs is None:
+            outputs = _run_threaded(single, [results[i]["args"] for i in valid], max_workers)
+
+        for index, output in zip(valid, outputs):
+            results[index].update(output)
+        return json.dumps(results, default=str)
+
+    summary = (getattr(getattr(single, "func", None), "__doc__", None) or single.description).strip()
+    example = json.dumps({"calls": [{field: "..." for field in fields}]})
+    def cache_results(args: Any = None, result: Any = None) -> bool:
+        # Looked up on every call, so a cache_function set on the single tool later still applies
+        try:
+            results = json.loads(result)
+        except (TypeError, json.JSONDecodeError):
+            return False
+        return bool(results) and all("result" in entry and single.cache_function(entry["args"], entry["result"]) for entry in results)
+
+    run_batch.__doc__ = (
+        f"Runs {single.name} once per argument set in a single action, use it instead of calling {single.name} many times. "
+        f"calls is a list of argument sets for {single.name}, e.g. {example}. "
+        f"Returns a JSON list with the result of each argument set, in order. {single.name}: {summary}"
+    )
+    # Lets tool_versions() give the batch a new version when the single tool changes
+    run_batch.batch_of = single
+    batch = tool(batch_name)(run_batch)
+    batch.cache_function = cache_results
+    return batch
+
+
+def _run_vectorized(vectorized: Callable[..., Any], fields: List[str], calls: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """One call over all argument sets, None if the function cannot handle them."""
+    columns = []
+    for field in fields:
+        values = [call[field] for call in calls]
+        dtype = None
+        if all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+            dtype = object if any(abs(value) >= _EXACT_INT_LIMIT for value in values) else _INT_DTYPE
+        columns.append(np.array(values, dtype=dtype))
+    try:
+        outputs = np.asarray(vectorized(*columns))
+    except Exception:
+        return None
+    if outputs.shape != (len(calls),):
+        return None
+    return [{"result": output} for output in outputs.tolist()]
+
+
+def _run_threaded(single: BaseTool, calls: List[Dict[str, Any]], max_workers: int) -> List[Dict[str, Any]]:
+    def run_one(args: Dict[str, Any]) -> Dict[str, Any]:
+        # A failing argument set does not fail the others
+        try:
+            return {"result": single.run(**args)}
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+
+    if not calls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+        return list(executor.map(run_one, calls))
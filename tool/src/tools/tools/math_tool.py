@@ -1,5 +1,8 @@
+import numpy as np
 from crewai.tools import tool
 
+from tools.tools.batch_tool import batch_tool
+
 @tool
 def multiplication_tool(first_number: int, second_number: int) -> int:
     """Useful for when you need to multiply two numbers together."""
@@ -12,4 +15,7 @@ def cache_func(args, result):
     print(f"Cache Status: {'Cached ✅' if cache else 'Not Cached ❌'} (Result: {result})")
     return cache
 
-multiplication_tool.cache_function = cache_func
\ No newline at end of file
+multiplication_tool.cache_function = cache_func
+
+# Many multiplications in one action, computed with a single NumPy call
+multiplication_tool_batch = batch_tool(multiplication_tool, vectorized=np.multiply)
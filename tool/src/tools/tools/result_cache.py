@@ -0,0 +1,168 @@
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from crewai.agents.cache.cache_handler import CacheHandler
+from pydantic import Field, PrivateAttr
+
+TOOL_CACHE_PATH = os.getenv("TOOL_CACHE_PATH", "outputs/tool_cache.sqlite3")
+
+
+def canonical_args(input: Any) -> str:
+    """Same arguments, same text: JSON with sorted keys, whatever order or format the LLM wrote them in."""
+    if isinstance(input, str):
+        try:
+            input = json.loads(input)
+        except json.JSONDecodeError:
+            return input.strip()
+    return json.dumps(input, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def tool_versions(tools: Iterable[Any]) -> Dict[str, str]:
+    """Version of each tool for the cache keys, a hash of its function's source.
+
+    Editing a tool's code changes its version, so results of the old code are
+    never served for it. A batch tool (see batch_tool()) also changes version
+    with the tool it batches.
+    """
+    versions = {}
+    for tool in tools:
+        func = getattr(tool, "func", None) or getattr(tool, "_run", None)
+        try:
+            source = inspect.getsource(func)
+        except (OSError, TypeError):
+            source = ""
+        single = getattr(func, "batch_of", None)
+        if single is not None:
+            source += tool_versions([single])[single.name]
+        versions[tool.name] = hashlib.sha256(source.encode("utf-8")).hexdigest()[:12] if source else "0"
+    return versions
+
+
+class PersistentCacheHandler(CacheHandler):
+    """Tool result cache with an in-memory LRU+TTL tier in front of a SQLite file.
+
+    Drop-in for crewAI's CacheHandler: Agent(cache_handler=handler, ...) with
+    Crew(cache=False), otherwise the crew replaces it with its own in-memory
+    cache. Entries are keyed by (tool name, canonical arguments, tool version)
+    and stay warm across kickoffs and across processes sharing the file.
+    crewAI only calls add() when the tool's cache_function agrees, so that
+    predicate still decides what is cached.
+    """
+
+    path: str = Field(default=TOOL_CACHE_PATH, description="SQLite file of the disk tier")
+    ttl: Optional[float] = Field(default=None, description="Seconds a result stays valid, None for no expiry")
+    max_memory_entries: int = Field(default=1024, description="Size of the in-memory LRU tier")
+    versions: Dict[str, str] = Field(default_factory=dict, description="Tool name to version, see tool_versions()")
+
+    _memory: "OrderedDict[str, Tuple[Any, Optional[float]]]" = PrivateAttr(default_factory=OrderedDict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _conn: Optional[sqlite3.Connection] = PrivateAttr(default=None)
+    _stats: Dict[str, int] = PrivateAttr(
+        default_factory=lambda: {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0, "evictions": 0, "expirations": 0}
+    )
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS tool_results (
+                    key TEXT PRIMARY KEY,
+                    tool TEXT NOT NULL,
+                    args TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    output TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL
+                )"""
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _key(self, tool: str, input: Any) -> Tuple[str, str, str]:
+        args = canonical_args(input)
+        version = self.versions.get(tool, "0")
+        key = hashlib.sha256(f"{tool}\0{args}\0{version}".encode("utf-8")).hexdigest()
+        return key, args, version
+
+    def add(self, tool, input, output):
+        key, args, version = self._key(tool, input)
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl else None
+        with self._lock:
+            self._remember(key, output, expires_at)
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO tool_results (key, tool, args, version, output, created_at, expires_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, tool, args, version, json.dumps(output, default=str), now, expires_at),
+                )
+            self._stats["writes"] += 1
+
+    def read(self, tool, input) -> Optional[str]:
+        key, _, _ = self._key(tool, input)
+        now = time.time()
+        with self._lock:
+            if key in self._memory:
+                output, expires_at = self._memory[key]
+                if expires_at is None or expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return output
+                del self._memory[key]
+                self._stats["expirations"] += 1
+
+            row = self._connect().execute("SELECT output, expires_at FROM tool_results WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                output, expires_at = json.loads(row[0]), row[1]
+                if expires_at is None or expires_at > now:
+                    self._remember(key, output, expires_at)
+                    self._stats["disk_hits"] += 1
+                    return output
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM tool_results WHERE key = ? AND expires_at <= ?", (key, now))
+                self._stats["expirations"] += 1
+
+            self._stats["misses"] += 1
+            return None
+
+    def _remember(self, key: str, output: Any, expires_at: Optional[float]) -> None:
+        self._memory[key] = (output, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def purge(self) -> int:
+        """Deletes the expired results from the disk tier, returns how many."""
+        with self._lock, self._connect() as conn:
+            deleted = conn.execute("DELETE FROM tool_results WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)).rowcount
+            self._stats["expirations"] += deleted
+            return deleted
+
+    def clear(self, tool: Optional[str] = None) -> None:
+        """Forgets every result, or the results of one tool."""
+        with self._lock, self._connect() as conn:
+            if tool is None:
+                conn.execute("DELETE FROM tool_results")
+            else:
+                conn.execute("DELETE FROM tool_results WHERE tool = ?", (tool,))
+            self._memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit, miss, write, eviction and expiration counters of this process."""
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+            stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+            stats["memory_entries"] = len(self._memory)
+            stats["disk_entries"] = self._connect().execute("SELECT COUNT(*) FROM tool_results").fetchone()[0]
+            return stats